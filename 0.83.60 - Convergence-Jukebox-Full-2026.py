@@ -31,39 +31,184 @@ Version 0.83.60 Changes:
 # SECTION 1: CONSOLIDATED IMPORTS
 # ============================================================================
 
-from PIL import Image
-from PIL import ImageDraw
-from PIL import ImageFont
+from __future__ import annotations
+
 from background_image_module import background_image
-from calendar import c
+from button_state_module import set_disabled
 from control_button_screen_layout_module import create_control_button_screen_layout
-from datetime import datetime, timedelta
-from datetime import datetime, timedelta # required for logging timestamp
 from disable_a_selection_buttons_module import disable_a_selection_buttons as disable_a_buttons_module
 from disable_b_selection_buttons_module import disable_b_selection_buttons as disable_b_buttons_module
 from disable_c_selection_buttons_module import disable_c_selection_buttons as disable_c_buttons_module
 from enable_all_buttons_module import enable_all_buttons as enable_all_buttons_module
 from font_size_window_updates_module import reset_button_fonts, update_selection_button_text, adjust_button_fonts_by_length, create_font_size_window_updates
-from gc import disable
 from info_screen_layout_module import create_info_screen_layout
 from jukebox_selection_screen_layout_module import create_jukebox_selection_screen_layout
 from operator import itemgetter
-from popup_45rpm_now_playing_code_module import display_45rpm_now_playing_popup
-from metadata_progress_bar_module import MetadataProgressBar
-from popup_45rpm_song_selection_code_module import display_45rpm_popup
-from popup_rotating_record_code_module import display_rotating_record_popup, log_popup_event
 from song_label_cache_module import clear_cache as clear_song_label_cache
 import artist_label_mapping_module  # Load artist-to-label mappings at startup
 import year_range_label_mapping_module  # Load year-range-to-label mappings at startup
+from collections import ChainMap, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from queue import Queue, Empty
-from search_window_button_layout_module import create_search_window_button_layout
-from search_module import run_search
+from search_module import build_search_indexes, run_search
 from the_bands_name_check_module import the_bands_name_check as check_bands_module
-from tinytag import TinyTag
-from token import NUMBER
-from typing import List, Dict, Any, Optional, Tuple
+from window_visibility_module import hide_windows, unhide_windows
+from console_log_module import console_log
+from typing import TYPE_CHECKING
+import FreeSimpleGUI as sg
+import atexit
+import gc
+import json
+import mmap
+import os
+import random
+import sys
+import threading
+import time
+
+# Type hints are only needed by type checkers (annotations are not evaluated at runtime)
+if TYPE_CHECKING:
+    from typing import List, Deque, Dict, Any, FrozenSet, Iterator, Mapping, Optional, TextIO, Tuple
+    import vlc
+
+# orjson is optional - the standard library json module is used when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# msgpack is optional - when installed MusicMasterSongList.txt is stored as MessagePack instead of JSON
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# Heavy modules (PIL, pygame, tinytag, psutil, vlc and the popup modules) are imported
+# lazily inside the functions that use them to keep cold-start time down
 # from upcoming_selections_update_module import update_upcoming_selections
 
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes read from a data file, using orjson when available
+
+    Args:
+        data (bytes): Raw file contents
+
+    Returns:
+        Any: The decoded data
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize data for a data file, using orjson when available
+
+    Args:
+        obj (Any): Data to serialize
+        indent (bool): Indent with 2 spaces (used for human-edited files); otherwise
+            the output is compact, with no spaces after separators
+
+    Returns:
+        bytes: UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+def _json_load_mapped(file_path: str) -> Any:
+    """Parse a large JSON data file (e.g. MusicMasterSongList.txt) from a read-only memory map
+
+    With orjson the mapped pages are parsed in place, so the file is never copied
+    into an intermediate bytes object first.
+
+    Args:
+        file_path (str): Path to the JSON file
+
+    Returns:
+        Any: The decoded data
+    """
+    with open(file_path, 'rb') as f:
+        # Empty files can't be mapped - let the parser raise its usual decode error
+        if os.fstat(f.fileno()).st_size == 0:
+            return _json_loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if orjson is not None:
+                with memoryview(mapped) as view:
+                    return orjson.loads(view)
+            return json.loads(mapped[:])
+
+def _is_msgpack_file(file_path: str) -> bool:
+    """Check whether a song list file is MessagePack rather than JSON
+
+    JSON text always starts with an ASCII byte, while a MessagePack-encoded list starts
+    with an array marker byte (0x90 and above).
+
+    Args:
+        file_path (str): Path to the song list file
+
+    Returns:
+        bool: True if the file holds MessagePack data
+    """
+    with open(file_path, 'rb') as f:
+        first_byte: bytes = f.read(1)
+    return bool(first_byte) and first_byte[0] >= 0x80
+
+def _song_list_dumps(obj: Any) -> bytes:
+    """Serialize the master song list, as MessagePack when msgpack is available
+
+    Args:
+        obj (Any): Song list rows to serialize
+
+    Returns:
+        bytes: Encoded song list
+    """
+    if msgpack is not None:
+        return msgpack.packb(obj, use_bin_type=True)
+    return _json_dumps(obj)
+
+def _load_song_list(file_path: str) -> Any:
+    """Load the master song list from either its MessagePack or JSON form
+
+    Args:
+        file_path (str): Path to MusicMasterSongList.txt
+
+    Returns:
+        Any: The decoded song list
+
+    Raises:
+        ValueError: If the file is MessagePack but msgpack is not installed, or can't be decoded
+    """
+    if not _is_msgpack_file(file_path):
+        return _json_load_mapped(file_path)
+    if msgpack is None:
+        raise ValueError(f"{file_path} is MessagePack-encoded but msgpack is not installed")
+    with open(file_path, 'rb') as f:
+        return msgpack.unpackb(f.read(), raw=False)
+
+# Log timestamp format, same layout as str() of a datetime with no microseconds
+_TS_FMT = '%Y-%m-%d %H:%M:%S'
+# Added to the epoch time before truncating, so timestamps round to the nearest second
+_TS_ROUNDING = 0.5
+# Last (second, formatted string) pair returned by _rounded_timestamp_str()
+_ts_cache = (0, '')
+
+def _rounded_timestamp_str():
+    """Return the local time rounded to the nearest second, formatted with _TS_FMT
+
+    Calls within the same second reuse the previously formatted string.
+    """
+    global _ts_cache
+    ts = int(time.time() + _TS_ROUNDING)
+    ts_cache = _ts_cache
+    if ts_cache[0] != ts:
+        ts_cache = _ts_cache = (ts, time.strftime(_TS_FMT, time.localtime(ts)))
+    return ts_cache[1]
+
+# Precomputed MM:SS strings for the first hour so the countdown tick doesn't format a new string
+_MMSS = tuple(f"{i // 60:02d}:{i % 60:02d}" for i in range(3600))
+
 def format_time_remaining(seconds):
     """
     Format seconds as MM:SS for display.
@@ -76,12 +221,29 @@ def format_time_remaining(seconds):
     """
     # Convert to integer first to eliminate floating point precision issues
     seconds = int(seconds)
+    if 0 <= seconds < 3600:
+        return _MMSS[seconds]
     if seconds < 0:
-        seconds = 0
-    minutes = seconds // 60
-    secs = seconds % 60
+        return _MMSS[0]
+    minutes, secs = divmod(seconds, 60)
     return f"{minutes:02d}:{secs:02d}"
 
+# Element keys for the upcoming songs display (from info_screen_layout_module.py)
+UPCOMING_KEYS = (
+    '--upcoming_one--',
+    '--upcoming_two--',
+    '--upcoming_three--',
+    '--upcoming_four--',
+    '--upcoming_five--',
+    '--upcoming_six--',
+    '--upcoming_seven--',
+    '--upcoming_eight--',
+    '--upcoming_nine--',
+    '--upcoming_ten--'
+)
+# Constant "1. " ... "10. " prefixes for the upcoming songs display
+_UPCOMING_PREFIXES = tuple(f"{i+1}. " for i in range(len(UPCOMING_KEYS)))
+
 # INLINE: Fixed function to update upcoming selections display using correct element keys
 def update_upcoming_selections(window, upcoming_list):
     """Update upcoming selections display in the info screen window using individual element keys"""
@@ -89,68 +251,63 @@ def update_upcoming_selections(window, upcoming_list):
         if not window:
             return
 
-        # Element keys for the upcoming songs display (from info_screen_layout_module.py)
-        upcoming_keys = [
-            '--upcoming_one--',
-            '--upcoming_two--',
-            '--upcoming_three--',
-            '--upcoming_four--',
-            '--upcoming_five--',
-            '--upcoming_six--',
-            '--upcoming_seven--',
-            '--upcoming_eight--',
-            '--upcoming_nine--',
-            '--upcoming_ten--'
-        ]
-
-        # Clear all upcoming selection displays first
-        for key in upcoming_keys:
-            try:
-                if key in window.AllKeysDict:
-                    window[key].update('')
-            except Exception as e:
-                continue
-
-        # Update with actual upcoming songs
-        if upcoming_list and len(upcoming_list) > 0:
-            for i, song in enumerate(upcoming_list):
-                if i >= len(upcoming_keys):
-                    break  # Don't exceed available elements
-                try:
-                    if upcoming_keys[i] in window.AllKeysDict:
-                        window[upcoming_keys[i]].update(f"{i+1}. {song}")
-                except Exception as e:
-                    continue
+        # Resolve the upcoming elements once per window and cache them on the window object,
+        # so a new window (different identity) automatically gets its own lookup
+        upcoming_elements = getattr(window, '_upcoming_cache', None)
+        if upcoming_elements is None:
+            upcoming_elements = tuple(window[key] for key in UPCOMING_KEYS if key in window.AllKeysDict)
+            window._upcoming_cache = upcoming_elements
+            # None forces every element to be written on the first call
+            window._last_upcoming = [None] * len(upcoming_elements)
+        last_upcoming = window._last_upcoming
+
+        # Build the new display text (don't exceed available elements), blank for unused slots
+        new_values = [_UPCOMING_PREFIXES[i] + song for i, song in enumerate(upcoming_list[:len(upcoming_elements)])] if upcoming_list else []
+        new_values += [''] * (len(upcoming_elements) - len(new_values))
+
+        # Only update elements whose text actually changed since the last refresh
+        for i, value in enumerate(new_values):
+            if value != last_upcoming[i]:
+                upcoming_elements[i].update(value)
+                last_upcoming[i] = value
 
     except Exception as e:
         import traceback
         traceback.print_exc()
-import FreeSimpleGUI as sg
-import gc
-import glob
-import json
-import os
-import psutil
-import pygame
-import random
-import sys
-import textwrap
-import threading
-import time
 
-# Suppress VLC stderr ONLY during import to prevent plugin cache messages
-import sys as _sys_for_vlc_suppress
-_vlc_stderr_backup = _sys_for_vlc_suppress.stderr
-_vlc_devnull = open(__import__('os').devnull, 'w')
-_sys_for_vlc_suppress.stderr = _vlc_devnull
-try:
-    import vlc
-finally:
-    _sys_for_vlc_suppress.stderr = _vlc_stderr_backup
-    _vlc_devnull.close()
+# Shared VLC instance, created on first playback by _get_vlc_instance()
+_vlc_instance = None
+_vlc_instance_lock = threading.Lock()
+
+# Write-only /dev/null descriptor, opened once and reused whenever VLC output is silenced
+_DEVNULL_FD = os.open(os.devnull, os.O_WRONLY)
+
+def _get_vlc_instance():
+    """Import VLC and create the global VLC instance on first use.
 
-# Create a global VLC instance with arguments to suppress error messages
-vlc_instance = vlc.Instance('--quiet', '--no-video')
+    The import is deferred until the first song or sound effect is played. Both the
+    engine thread and the GUI thread play audio, so creation is guarded by a lock.
+
+    Returns:
+        vlc.Instance: The shared VLC instance
+    """
+    global _vlc_instance
+    if _vlc_instance is None:
+        with _vlc_instance_lock:
+            if _vlc_instance is None:
+                # Suppress VLC stderr during import and instance creation to prevent plugin cache
+                # messages. libvlc writes to file descriptor 2 directly from C, so swapping
+                # sys.stderr is not enough - fd 2 itself is pointed at devnull with os.dup2
+                _saved_stderr_fd = os.dup(2)
+                os.dup2(_DEVNULL_FD, 2)
+                try:
+                    import vlc
+                    # Create a global VLC instance with arguments to suppress error messages
+                    _vlc_instance = vlc.Instance('--quiet', '--no-video')
+                finally:
+                    os.dup2(_saved_stderr_fd, 2)
+                    os.close(_saved_stderr_fd)
+    return _vlc_instance
 
 # ============================================================================
 # SECTION 2: UTILITY CLASSES
@@ -159,6 +316,8 @@ vlc_instance = vlc.Instance('--quiet', '--no-video')
 
 class Colors:
     """ANSI color codes for terminal output"""
+    __slots__ = ()
+
     HEADER: str = '\033[95m'
     BLUE: str = '\033[94m'
     CYAN: str = '\033[96m'
@@ -177,10 +336,28 @@ class Colors:
             # We'll keep colors enabled by default
             pass
 
+    @staticmethod
+    def disable() -> None:
+        """Blank out all color codes (used when output is not a terminal)"""
+        for color_name in ('HEADER', 'BLUE', 'CYAN', 'GREEN', 'YELLOW', 'RED', 'ENDC', 'BOLD', 'UNDERLINE'):
+            setattr(Colors, color_name, '')
+
+
+# Escape codes are just noise when output is redirected to a file or pipe
+if sys.stdout is None or not sys.stdout.isatty():
+    Colors.disable()
+
+# Prebuilt colored prefixes for the engine's console output helpers
+_SECTION_PREFIX: str = f"{Colors.CYAN}{Colors.BOLD}"
+_SUCCESS_PREFIX: str = f"{Colors.GREEN}[+] "
+_WARNING_PREFIX: str = f"{Colors.YELLOW}[!] "
+_ERROR_PREFIX: str = f"{Colors.RED}[-] "
+_COLOR_END: str = Colors.ENDC
+
 
 class JukeboxEngineException(Exception):
     """Custom exception for Jukebox Engine errors"""
-    pass
+    __slots__ = ()
 
 
 # ============================================================================
@@ -204,17 +381,42 @@ class JukeboxEngine:
     """
 
     # Configuration constants
-    SLEEP_TIME: float = 0.5
-    TIMESTAMP_ROUNDING: float = 0.5
+    PLAYBACK_CHECK_INTERVAL: float = 5.0
+    NORANDOM_BIT: int = 1
+    PROGRESS_UPDATE_INTERVAL: int = 32
+    METADATA_READ_WORKERS: int = 32
     CONFIG_FILE: str = 'jukebox_config.json'
     GC_THRESHOLD: int = 100
 
+    # Config 'paths' keys, each stored as an attribute of the same name joined onto dir_path
+    PATH_KEYS: Tuple[str, ...] = (
+        'music_dir',
+        'log_file',
+        'genre_flags_file',
+        'music_master_song_list_file',
+        'music_master_song_list_check_file',
+        'paid_music_playlist_file',
+        'current_song_playing_file',
+        'metadata_cache_file',
+    )
+
     def __init__(self) -> None:
         """Initialize Jukebox Engine with all required variables and file setup"""
         # Initialize data structures
         self.music_id3_metadata_list: List[tuple] = []
-        self.music_master_song_list: List[Dict[str, str]] = []
-        self.random_music_playlist: List[int] = []
+        # Master song list held as parallel per-field lists (Struct-of-Arrays) indexed by song number
+        self.song_locations: List[str] = []
+        self.song_titles: List[str] = []
+        self.song_artists: List[str] = []
+        self.song_albums: List[str] = []
+        self.song_years: List[str] = []
+        self.song_comments: List[str] = []
+        self.song_durations: List[str] = []
+
+        # Per-song genre bitmasks and the bit assigned to each genre word (see _index_song_genres)
+        self.song_genre_masks: List[int] = []
+        self._genre_bits: Dict[str, int] = {}
+        self.random_music_playlist: Deque[int] = deque()
         self.paid_music_playlist: List[int] = []
         self.final_genre_list: List[str] = []
 
@@ -224,6 +426,10 @@ class JukeboxEngine:
         # VLC Media Player instance for accessing playback state
         self.vlc_media_player = None
 
+        # Persistent line-buffered handle for log.txt, opened on first write and closed by close()
+        self._log_fh: Optional[TextIO] = None
+        atexit.register(self.close)
+
         # Current song metadata
         self.artist_name: str = ""
         self.song_name: str = ""
@@ -233,35 +439,43 @@ class JukeboxEngine:
         self.song_genre: str = ""
 
         # Genre flags
-        self.genre0: str = "null"
-        self.genre1: str = "null"
-        self.genre2: str = "null"
-        self.genre3: str = "null"
+        self.genres: Tuple[str, str, str, str] = ('null',) * 4
+        self._active_genres: FrozenSet[str] = frozenset()
+        self._no_genre_filter: bool = True
 
         # Get directory path for cross-platform compatibility
         self.dir_path: str = os.path.dirname(os.path.realpath(__file__))
 
         # Load configuration
-        self.config: Dict[str, Any] = self._load_config()
+        self.config: Mapping[str, Any] = self._load_config()
+
+        # Cache the config flags read on every print, log and playback call as plain bools
+        console_config: Mapping[str, Any] = self.config['console']
+        self._colors_on: bool = bool(console_config['colors_enabled'])
+        self._logging_on: bool = bool(self.config['logging']['enabled'])
+        self._verbose: bool = bool(console_config['verbose'])
+        self._show_sysinfo: bool = bool(console_config['show_system_info'])
 
         # Define standard file and directory paths using os.path.join for cross-platform compatibility
-        self.music_dir: str = os.path.join(self.dir_path, self.config['paths']['music_dir'])
-        self.log_file: str = os.path.join(self.dir_path, self.config['paths']['log_file'])
-        self.genre_flags_file: str = os.path.join(self.dir_path, self.config['paths']['genre_flags_file'])
-        self.music_master_song_list_file: str = os.path.join(self.dir_path, self.config['paths']['music_master_song_list_file'])
-        self.music_master_song_list_check_file: str = os.path.join(self.dir_path, self.config['paths']['music_master_song_list_check_file'])
-        self.paid_music_playlist_file: str = os.path.join(self.dir_path, self.config['paths']['paid_music_playlist_file'])
-        self.current_song_playing_file: str = os.path.join(self.dir_path, self.config['paths']['current_song_playing_file'])
+        # (self.music_dir, self.log_file, ... one attribute per entry in PATH_KEYS). The bare
+        # file names used in console messages are worked out once here as well
+        dir_path: str = self.dir_path
+        config_paths: Mapping[str, str] = self.config['paths']
+        self.file_names: Dict[str, str] = {}
+        for path_key in self.PATH_KEYS:
+            full_path: str = os.path.join(dir_path, config_paths[path_key])
+            setattr(self, path_key, full_path)
+            self.file_names[path_key] = os.path.basename(full_path)
 
         # Initialize log file and required data files
         self._setup_files()
         self._print_header("Jukebox Engine Initialized")
 
-    def _load_config(self) -> Dict[str, Any]:
+    def _load_config(self) -> Mapping[str, Any]:
         """Load configuration from config file or create default config
 
         Returns:
-            Dict[str, Any]: Configuration dictionary
+            Mapping[str, Any]: Configuration mapping
         """
         config_path: str = os.path.join(self.dir_path, self.CONFIG_FILE)
 
@@ -279,7 +493,8 @@ class JukeboxEngine:
                 "music_master_song_list_file": "MusicMasterSongList.txt",
                 "music_master_song_list_check_file": "MusicMasterSongListCheck.txt",
                 "paid_music_playlist_file": "PaidMusicPlayList.txt",
-                "current_song_playing_file": "CurrentSongPlaying.txt"
+                "current_song_playing_file": "CurrentSongPlaying.txt",
+                "metadata_cache_file": "MusicMetadataCache.txt"
             },
             "console": {
                 "colors_enabled": True,
@@ -291,8 +506,8 @@ class JukeboxEngine:
         # Try to load existing config
         if os.path.exists(config_path):
             try:
-                with open(config_path, 'r') as config_file:
-                    loaded_config: Dict[str, Any] = json.load(config_file)
+                with open(config_path, 'rb') as config_file:
+                    loaded_config: Dict[str, Any] = _json_loads(config_file.read())
                     # Merge with defaults to ensure all keys exist
                     return self._merge_configs(default_config, loaded_config)
             except (IOError, json.JSONDecodeError) as e:
@@ -302,30 +517,32 @@ class JukeboxEngine:
         else:
             # Create default config file
             try:
-                with open(config_path, 'w') as config_file:
-                    json.dump(default_config, config_file, indent=2)
+                with open(config_path, 'wb') as config_file:
+                    config_file.write(_json_dumps(default_config, indent=True))
                 print(f"{Colors.GREEN}Created default config file: {config_path}{Colors.ENDC}")
             except IOError as e:
                 print(f"{Colors.YELLOW}Warning: Failed to create config file: {e}{Colors.ENDC}")
 
             return default_config
 
-    def _merge_configs(self, default: Dict[str, Any], loaded: Dict[str, Any]) -> Dict[str, Any]:
+    def _merge_configs(self, default: Dict[str, Any], loaded: Dict[str, Any]) -> ChainMap[str, Any]:
         """Merge loaded config with default config, preserving defaults for missing keys
 
+        Lookups fall through from the loaded config to the defaults, so no dictionaries
+        are copied; only sections present in both get their own nested ChainMap.
+
         Args:
             default (Dict[str, Any]): Default configuration
             loaded (Dict[str, Any]): Loaded configuration
 
         Returns:
-            Dict[str, Any]: Merged configuration
+            ChainMap[str, Any]: Merged configuration
         """
-        merged: Dict[str, Any] = default.copy()
-        for key, value in loaded.items():
-            if isinstance(value, dict) and key in merged and isinstance(merged[key], dict):
-                merged[key] = {**merged[key], **value}
-            else:
-                merged[key] = value
+        merged: ChainMap[str, Any] = ChainMap({}, loaded, default)
+        for key, default_value in default.items():
+            loaded_value: Any = loaded.get(key)
+            if isinstance(default_value, dict) and isinstance(loaded_value, dict):
+                merged[key] = ChainMap(loaded_value, default_value)
         return merged
 
     # ============================================================================
@@ -348,8 +565,8 @@ class JukeboxEngine:
         if index < 0:
             return False, f"Song index cannot be negative: {index}"
 
-        if index >= len(self.music_master_song_list):
-            return False, f"Song index {index} out of range (max: {len(self.music_master_song_list) - 1})"
+        if index >= len(self.song_locations):
+            return False, f"Song index {index} out of range (max: {len(self.song_locations) - 1})"
 
         return True, ""
 
@@ -392,18 +609,18 @@ class JukeboxEngine:
         if data_type == 'playlist':
             if not isinstance(data, list):
                 return False, f"Playlist must be list, got {type(data).__name__}"
-            for item in data:
-                if not isinstance(item, int):
-                    return False, f"Playlist items must be integers, got {type(item).__name__}"
+            if not all(type(item) is int for item in data):
+                bad_item: Any = next(item for item in data if type(item) is not int)
+                return False, f"Playlist items must be integers, got {type(bad_item).__name__}"
 
         elif data_type == 'genres':
             if not isinstance(data, list):
                 return False, f"Genres must be list, got {type(data).__name__}"
             if len(data) != 4:
                 return False, f"Genres list must have 4 items, got {len(data)}"
-            for item in data:
-                if not isinstance(item, str):
-                    return False, f"Genre items must be strings, got {type(item).__name__}"
+            if not all(type(item) is str for item in data):
+                bad_item: Any = next(item for item in data if type(item) is not str)
+                return False, f"Genre items must be strings, got {type(bad_item).__name__}"
 
         elif data_type == 'statistics':
             if not isinstance(data, dict):
@@ -445,8 +662,8 @@ class JukeboxEngine:
                 self._log_error(f"Cannot read file: {error_msg}")
                 return False, None
 
-            with open(file_path, 'r') as f:
-                data = json.load(f)
+            with open(file_path, 'rb') as f:
+                data = _json_loads(f.read())
             return True, data
         except (IOError, json.JSONDecodeError) as e:
             self._log_error(f"Failed to read JSON file {file_path}: {e}")
@@ -467,10 +684,12 @@ class JukeboxEngine:
                 self._log_error("Cannot write file: path is empty")
                 return False
 
-            with open(file_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            # Serialize first so unencodable data fails before the file is truncated
+            payload: bytes = _json_dumps(data, indent=True)
+            with open(file_path, 'wb') as f:
+                f.write(payload)
             return True
-        except (IOError, json.JSONDecodeError) as e:
+        except (IOError, TypeError, json.JSONDecodeError) as e:
             self._log_error(f"Failed to write JSON file {file_path}: {e}")
             return False
 
@@ -484,9 +703,10 @@ class JukeboxEngine:
         if not success:
             return False, []
 
-        is_valid, error_msg = self._validate_json_data(data, 'playlist')
-        if not is_valid:
-            self._log_error(f"Invalid paid playlist data: {error_msg}")
+        # The file is only ever written by the jukebox itself, so checking the container and
+        # the first entry is enough to catch a malformed file without a full validation pass
+        if not isinstance(data, list) or (data and type(data[0]) is not int):
+            self._log_error("Invalid paid playlist data: expected a list of integers")
             return False, []
 
         return True, data
@@ -500,11 +720,7 @@ class JukeboxEngine:
         Returns:
             bool: True if successful, False otherwise
         """
-        is_valid, error_msg = self._validate_json_data(playlist, 'playlist')
-        if not is_valid:
-            self._log_error(f"Cannot write playlist: {error_msg}")
-            return False
-
+        # No separate validation pass - the serializer rejects anything it can't encode
         return self._write_json_file(self.paid_music_playlist_file, playlist)
 
     def _read_genres(self) -> Tuple[bool, List[str]]:
@@ -527,11 +743,20 @@ class JukeboxEngine:
     def _read_master_song_list(self) -> Tuple[bool, List[Dict[str, str]]]:
         """Read master song list file with validation.
 
+        Reads either the MessagePack or the JSON form of the file through _load_song_list().
+
         Returns:
             Tuple[bool, List[Dict]]: (success, song_list)
         """
-        success, data = self._read_json_file(self.music_master_song_list_file)
-        if not success:
+        try:
+            is_valid, error_msg = self._validate_file_path(self.music_master_song_list_file)
+            if not is_valid:
+                self._log_error(f"Cannot read file: {error_msg}")
+                return False, []
+
+            data = _load_song_list(self.music_master_song_list_file)
+        except (IOError, ValueError) as e:
+            self._log_error(f"Failed to read song list {self.music_master_song_list_file}: {e}")
             return False, []
 
         if not isinstance(data, list):
@@ -550,7 +775,7 @@ class JukeboxEngine:
         Args:
             message (str): The message to display
         """
-        if self.config['console']['colors_enabled']:
+        if self._colors_on:
             print(f"\n{Colors.HEADER}{Colors.BOLD}{'='*60}")
             print(f"{message.center(60)}")
             print(f"{'='*60}{Colors.ENDC}\n")
@@ -565,8 +790,8 @@ class JukeboxEngine:
         Args:
             message (str): The section message
         """
-        if self.config['console']['colors_enabled']:
-            print(f"{Colors.CYAN}{Colors.BOLD}{message}{Colors.ENDC}")
+        if self._colors_on:
+            print(_SECTION_PREFIX + message + _COLOR_END)
         else:
             print(message)
 
@@ -576,8 +801,8 @@ class JukeboxEngine:
         Args:
             message (str): The success message
         """
-        if self.config['console']['colors_enabled']:
-            print(f"{Colors.GREEN}[+] {message}{Colors.ENDC}")
+        if self._colors_on:
+            print(_SUCCESS_PREFIX + message + _COLOR_END)
         else:
             print(f"[+] {message}")
 
@@ -587,8 +812,8 @@ class JukeboxEngine:
         Args:
             message (str): The warning message
         """
-        if self.config['console']['colors_enabled']:
-            print(f"{Colors.YELLOW}[!] {message}{Colors.ENDC}")
+        if self._colors_on:
+            print(_WARNING_PREFIX + message + _COLOR_END)
         else:
             print(f"[!] {message}")
 
@@ -598,86 +823,92 @@ class JukeboxEngine:
         Args:
             message (str): The error message
         """
-        if self.config['console']['colors_enabled']:
-            print(f"{Colors.RED}[-] {message}{Colors.ENDC}")
+        if self._colors_on:
+            print(_ERROR_PREFIX + message + _COLOR_END)
         else:
             print(f"[-] {message}")
 
-    def _get_rounded_timestamp(self) -> datetime:
-        """Helper method to get current timestamp rounded to nearest second
-
-        Returns:
-            datetime: Current timestamp rounded to nearest second
-        """
-        try:
-            now: datetime = datetime.now()
-            rounded_now: datetime = now + timedelta(seconds=self.TIMESTAMP_ROUNDING)
-            return rounded_now.replace(microsecond=0)
-        except Exception as e:
-            self._print_error_msg(f"Failed to get timestamp: {e}")
-            return datetime.now()
-
     def _log_error(self, error_message: str) -> None:
         """Log error message to both console and log file
 
         Args:
             error_message (str): The error message to log
         """
-        timestamp: datetime = self._get_rounded_timestamp()
+        timestamp: str = _rounded_timestamp_str()
         error_log: str = f"\n{timestamp} ERROR: {error_message}"
 
         # Only log to file if logging is enabled
-        if self.config['logging']['enabled']:
+        if self._logging_on:
             try:
-                with open(self.log_file, 'a') as log:
-                    log.write(error_log)
+                self._write_log(error_log)
             except Exception as e:
                 self._print_error_msg(f"Could not write to log file: {e}")
 
         self._print_error_msg(error_message)
 
+    def _write_log(self, text: str) -> None:
+        """Append text to the log file through the persistent handle
+
+        Args:
+            text (str): The text to append
+        """
+        if self._log_fh is None:
+            self._log_fh = open(self.log_file, 'a', buffering=1)
+        self._log_fh.write(text)
+
+    def close(self) -> None:
+        """Flush queued background writes and close the persistent log file handle"""
+        if file_io_worker.is_alive():
+            file_io_queue.put(None)
+            file_io_worker.join(timeout=2)
+
+        if self._log_fh is not None:
+            try:
+                self._log_fh.close()
+            except IOError as e:
+                self._print_error_msg(f"Could not close log file: {e}")
+            self._log_fh = None
+
     def _setup_files(self) -> None:
         """Check for files on disk. If they don't exist, create them"""
         # Create date and time stamp for log file
-        now: datetime = self._get_rounded_timestamp()
+        now: str = _rounded_timestamp_str()
 
         # Setup log file
         try:
             if not os.path.exists(self.log_file):
-                with open(self.log_file, 'w') as log:
-                    log.write(str(now) + ' Jukebox Engine Started - New Log File Created,')
-                self._print_success(f"Created log file: {os.path.basename(self.log_file)}")
+                self._write_log(now + ' Jukebox Engine Started - New Log File Created,')
+                self._print_success(f"Created log file: {self.file_names['log_file']}")
             else:
-                with open(self.log_file, 'a') as log:
-                    log.write('\n' + str(now) + ' Jukebox Engine Restarted,')
+                self._write_log('\n' + now + ' Jukebox Engine Restarted,')
         except IOError as e:
             self._log_error(f"Failed to setup log.txt: {e}")
 
         # Setup genre flags file
         try:
             if not os.path.exists(self.genre_flags_file):
-                with open(self.genre_flags_file, 'w') as genre_flags_file:
+                with open(self.genre_flags_file, 'wb') as genre_flags_file:
                     genre_flags_list: List[str] = ['null', 'null', 'null', 'null']
-                    json.dump(genre_flags_list, genre_flags_file)
-                self._print_success(f"Created genre flags file: {os.path.basename(self.genre_flags_file)}")
+                    genre_flags_file.write(_json_dumps(genre_flags_list))
+                self._print_success(f"Created genre flags file: {self.file_names['genre_flags_file']}")
         except (IOError, json.JSONDecodeError) as e:
             self._log_error(f"Failed to setup GenreFlagsList.txt: {e}")
 
         # Setup music master song list check file
         try:
             if not os.path.exists(self.music_master_song_list_check_file):
-                with open(self.music_master_song_list_check_file, 'w') as check_file:
-                    json.dump([], check_file)
-                self._print_success(f"Created song list check file: {os.path.basename(self.music_master_song_list_check_file)}")
+                with open(self.music_master_song_list_check_file, 'wb') as check_file:
+                    check_file.write(_json_dumps([]))
+                self._print_success(f"Created song list check file: {self.file_names['music_master_song_list_check_file']}")
         except (IOError, json.JSONDecodeError) as e:
             self._log_error(f"Failed to setup MusicMasterSongListCheck.txt: {e}")
 
         # Setup paid music playlist file
         try:
             if not os.path.exists(self.paid_music_playlist_file):
-                with open(self.paid_music_playlist_file, 'w') as paid_list_file:
-                    json.dump([], paid_list_file)
-                self._print_success(f"Created paid playlist file: {os.path.basename(self.paid_music_playlist_file)}")
+                with open(self.paid_music_playlist_file, 'wb') as paid_list_file:
+                    paid_list_file.write(_json_dumps([]))
+                self._print_success(f"Created paid playlist file: {self.file_names['paid_music_playlist_file']}")
         except (IOError, json.JSONDecodeError) as e:
             self._log_error(f"Failed to setup PaidMusicPlayList.txt: {e}")
 
@@ -708,39 +939,127 @@ class JukeboxEngine:
                 return False
 
             # Validate song index
-            if song_index >= len(self.music_master_song_list):
+            if song_index >= len(self.song_locations):
                 self._log_error(f"Song index {song_index} out of range")
                 return False
 
             # Assign song metadata to instance variables
-            self.artist_name = self.music_master_song_list[song_index]['artist']
-            self.song_name = self.music_master_song_list[song_index]['title']
-            self.album_name = self.music_master_song_list[song_index]['album']
-            self.song_duration = self.music_master_song_list[song_index]['duration']
-            self.song_year = self.music_master_song_list[song_index]['year']
-            self.song_genre = self.music_master_song_list[song_index]['comment']
+            self.artist_name = self.song_artists[song_index]
+            self.song_name = self.song_titles[song_index]
+            self.album_name = self.song_albums[song_index]
+            self.song_duration = self.song_durations[song_index]
+            self.song_year = self.song_years[song_index]
+            self.song_genre = self.song_comments[song_index]
             return True
         except (KeyError, IndexError, TypeError, ValueError) as e:
             self._log_error(f"Failed to assign {playlist_type} song data: {e}")
             return False
 
+    def _set_master_song_list(self, songs: List[Dict[str, str]]) -> None:
+        """Store the master song list rows as parallel per-field lists
+
+        Args:
+            songs (List[Dict[str, str]]): Rows in MusicMasterSongList.txt format
+        """
+        self.song_locations = [song['location'] for song in songs]
+        self.song_titles = [song['title'] for song in songs]
+        self.song_artists = [song['artist'] for song in songs]
+        self.song_albums = [song['album'] for song in songs]
+        self.song_years = [song['year'] for song in songs]
+        self.song_comments = [song['comment'] for song in songs]
+        self.song_durations = [song['duration'] for song in songs]
+        self._index_song_genres()
+
+    def _index_song_genres(self) -> None:
+        """Precompute a genre bitmask per song for the random playlist filter
+
+        Bit 0 marks songs tagged 'norandom'; every other genre word found in the song
+        comments is given its own bit, recorded in self._genre_bits. Most songs share a
+        handful of comment strings, so each distinct comment is only tokenized once.
+        """
+        genre_bits: Dict[str, int] = {}
+        comment_masks: Dict[str, int] = {}
+        song_genre_masks: List[int] = []
+        for song_comment in self.song_comments:
+            mask: Optional[int] = comment_masks.get(song_comment)
+            if mask is None:
+                genre_tokens: FrozenSet[str] = frozenset(song_comment.split())
+                mask = self.NORANDOM_BIT if 'norandom' in genre_tokens else 0
+                for genre in genre_tokens:
+                    bit: Optional[int] = genre_bits.get(genre)
+                    if bit is None:
+                        bit = genre_bits[genre] = self.NORANDOM_BIT << (len(genre_bits) + 1)
+                    mask |= bit
+                comment_masks[song_comment] = mask
+            song_genre_masks.append(mask)
+        self._genre_bits = genre_bits
+        self.song_genre_masks = song_genre_masks
+
+    def _iter_mp3_files(self) -> Iterator[str]:
+        """Yield the full path of each MP3 file in the music directory
+
+        normcase() makes the extension match case-insensitive on Windows only, the same
+        as glob's, so the count in run() and the files scanned always agree.
+
+        Yields:
+            str: Full path to an MP3 file
+        """
+        with os.scandir(self.music_dir) as music_dir_entries:
+            for entry in music_dir_entries:
+                if os.path.normcase(entry.name).endswith('.mp3') and entry.is_file():
+                    yield entry.path
+
+    @staticmethod
+    def _read_mp3_tags(tinytag_class: Any, file_path: str) -> Optional[Dict[str, str]]:
+        """Read the ID3 tags the jukebox needs from one MP3 file
+
+        Runs on a worker thread, so it only reads the file and touches no engine state.
+
+        Args:
+            tinytag_class (Any): The TinyTag class (imported lazily by the caller)
+            file_path (str): Full path to the MP3 file
+
+        Returns:
+            Optional[Dict[str, str]]: Extracted tags, or None if no metadata could be read
+        """
+        id3tag: Optional[Any] = tinytag_class.get(file_path)
+
+        if id3tag is None:
+            return None
+
+        # MM:SS, wrapping at an hour as the previous strftime("%M:%S") formatting did
+        song_duration: str = _MMSS[int(id3tag.duration) % 3600]
+
+        # Missing tags become empty strings rather than the literal text "None"
+        return {
+            'title': str(id3tag.title or ''),
+            'artist': str(id3tag.artist or ''),
+            'album': str(id3tag.album or ''),
+            'year': str(id3tag.year or ''),
+            'comment': str(id3tag.comment or ''),
+            'duration': song_duration
+        }
+
     def generate_mp3_metadata(self) -> bool:
         """Generate MP3 metadata from music directory
 
         Returns:
             bool: True if successful, False otherwise
         """
+        # Only needed when the song list is regenerated, so imported here rather than at startup
+        from metadata_cache_module import MetadataCache
+        from metadata_progress_bar_module import MetadataProgressBar
+        from tinytag import TinyTag
+
         progress_bar = None
         try:
             self._print_header("Generating MP3 Metadata")
             print("Please Be Patient - Regenerating Your Songlist From Scratch")
             print("Music Will Start When Finished\n")
 
-            counter: int = 0
-
             # Get music files using cross-platform path
             try:
-                mp3_music_files: List[str] = glob.glob(os.path.join(self.music_dir, '*.mp3'))
+                mp3_music_files: List[str] = list(self._iter_mp3_files())
             except Exception as e:
                 self._log_error(f"Failed to search for MP3 files: {e}")
                 return False
@@ -751,54 +1070,77 @@ class JukeboxEngine:
 
             print(f"Found {len(mp3_music_files)} MP3 files. Processing...\n")
 
+            # Load cached metadata so only new or changed files are parsed with TinyTag
+            metadata_cache = MetadataCache(self.metadata_cache_file, loads=_json_loads, dumps=_json_dumps)
+            metadata_cache.load()
+
             # Initialize and start progress bar in separate thread
             progress_bar = MetadataProgressBar(len(mp3_music_files))
             progress_bar.start()
 
+            # Check every file against the cache first
+            file_stats: Dict[str, os.stat_result] = {}
+            song_tags_by_file: Dict[str, Optional[Dict[str, str]]] = {}
             for file_path in mp3_music_files:
                 try:
-                    # Update progress bar with current file
-                    file_name = os.path.basename(file_path)
-                    progress_bar.update(counter, file_name)
-
-                    id3tag: Optional[Any] = TinyTag.get(file_path)
-
-                    if id3tag is None:
-                        self._log_error(f"Could not read metadata from {file_path}")
-                        continue
-
-                    get_song_duration_seconds: str = "%f" % id3tag.duration
-                    remove_song_duration_decimals: float = float(get_song_duration_seconds)
-                    song_duration_decimals_removed: int = int(remove_song_duration_decimals)
-                    song_duration_minutes_seconds: int = int(song_duration_decimals_removed)
-                    song_duration: str = time.strftime("%M:%S", time.gmtime(song_duration_minutes_seconds))
-
-                    song_metadata: List[Any] = list((
-                        counter,
-                        file_path,
-                        "%s" % id3tag.title,
-                        "%s" % id3tag.artist,
-                        "%s" % id3tag.album,
-                        "%s" % id3tag.year,
-                        "%s" % id3tag.comment,
-                        song_duration
-                    ))
-                    self.music_id3_metadata_list.append(song_metadata)
-                    counter += 1
-                except Exception as e:
+                    file_stats[file_path] = os.stat(file_path)
+                except OSError as e:
                     self._log_error(f"Failed to extract metadata from {file_path}: {e}")
                     continue
+                song_tags_by_file[file_path] = metadata_cache.get(file_path, file_stats[file_path])
+            files_to_scan: List[str] = [file_path for file_path, song_tags in song_tags_by_file.items() if song_tags is None]
+            cache_hits: int = len(song_tags_by_file) - len(files_to_scan)
+
+            # Parse the remaining files in parallel. A thread pool is used rather than a process
+            # pool because spawned worker processes would re-run this module's start-up code
+            # (log writes, data file creation, I/O worker thread). The scan is mostly waiting on
+            # file reads, so the pool is sized to keep METADATA_READ_WORKERS reads in flight
+            with ThreadPoolExecutor(max_workers=self.METADATA_READ_WORKERS) as executor:
+                futures = {executor.submit(self._read_mp3_tags, TinyTag, file_path): file_path for file_path in files_to_scan}
+                for scanned_count, future in enumerate(as_completed(futures), start=1):
+                    file_path = futures[future]
+                    # Update progress bar every PROGRESS_UPDATE_INTERVAL files and on the last one
+                    if scanned_count % self.PROGRESS_UPDATE_INTERVAL == 0 or scanned_count == len(futures):
+                        progress_bar.update(cache_hits + scanned_count, os.path.basename(file_path))
+                    try:
+                        song_tags_by_file[file_path] = future.result()
+                        if song_tags_by_file[file_path] is None:
+                            self._log_error(f"Could not read metadata from {file_path}")
+                    except Exception as e:
+                        self._log_error(f"Failed to extract metadata from {file_path}: {e}")
+
+            # Assign song numbers in directory order once all files are read, skipping unreadable files
+            readable_songs: List[Tuple[str, Dict[str, str]]] = [
+                (file_path, song_tags_by_file[file_path]) for file_path in mp3_music_files
+                if song_tags_by_file.get(file_path) is not None]
+            for counter, (file_path, song_tags) in enumerate(readable_songs):
+                metadata_cache.put(file_path, file_stats[file_path], song_tags)
+
+                song_metadata: List[Any] = list((
+                    counter,
+                    file_path,
+                    song_tags['title'],
+                    song_tags['artist'],
+                    song_tags['album'],
+                    song_tags['year'],
+                    song_tags['comment'],
+                    song_tags['duration']
+                ))
+                self.music_id3_metadata_list.append(song_metadata)
 
             # Stop progress bar and pause for 1 second
             if progress_bar:
                 progress_bar.stop()
                 time.sleep(1)  # Pause after progress bar closes
 
+            if not metadata_cache.save():
+                self._log_error(f"Failed to save {self.file_names['metadata_cache_file']}")
+
             if not self.music_id3_metadata_list:
                 self._log_error("No valid metadata was extracted from MP3 files")
                 return False
 
-            self._print_success(f"Extracted metadata from {counter} songs")
+            self._print_success(f"Extracted metadata from {len(self.music_id3_metadata_list)} songs ({cache_hits} from cache)")
             return True
         except Exception as e:
             # Ensure progress bar is stopped on error
@@ -820,23 +1162,31 @@ class JukeboxEngine:
             # Assign keys for MusicMasterSongList Dictionary
             keys: List[str] = ['number', 'location', 'title', 'artist', 'album', 'year', 'comment', 'duration']
 
-            # Build MusicMasterSongList Dictionary
-            self.music_master_song_list = [dict(zip(keys, sublst)) for sublst in self.music_id3_metadata_list]
+            # Build MusicMasterSongList Dictionary; the engine itself keeps only the per-field columns
+            music_master_song_list: List[Dict[str, str]] = [dict(zip(keys, sublst)) for sublst in self.music_id3_metadata_list]
+            if self.music_id3_metadata_list:
+                (_, self.song_locations, self.song_titles, self.song_artists, self.song_albums,
+                 self.song_years, self.song_comments, self.song_durations) = map(list, zip(*self.music_id3_metadata_list))
+                self._index_song_genres()
+            else:
+                self._set_master_song_list([])
+            # The raw metadata rows are not used again once the columns exist
+            self.music_id3_metadata_list.clear()
 
             # Save MusicMasterSongList Dictionary
             try:
-                with open(self.music_master_song_list_file, 'w') as master_list_file:
-                    json.dump(self.music_master_song_list, master_list_file)
-                self._print_success(f"Saved master song list to {os.path.basename(self.music_master_song_list_file)}")
+                with open(self.music_master_song_list_file, 'wb') as master_list_file:
+                    master_list_file.write(_song_list_dumps(music_master_song_list))
+                self._print_success(f"Saved master song list to {self.file_names['music_master_song_list_file']}")
             except (IOError, json.JSONDecodeError) as e:
                 self._log_error(f"Failed to save MusicMasterSongList.txt: {e}")
                 return False
 
             # Create and save a file list size value to check if MusicMasterSongList has changed after a reboot
-            list_size: int = len(self.music_master_song_list)
+            list_size: int = len(self.song_locations)
             try:
-                with open(self.music_master_song_list_check_file, 'w') as check_file:
-                    json.dump(list_size, check_file)
+                with open(self.music_master_song_list_check_file, 'wb') as check_file:
+                    check_file.write(_json_dumps(list_size))
                 self._print_success(f"Saved song list check file ({list_size} songs)")
             except (IOError, json.JSONDecodeError) as e:
                 self._log_error(f"Failed to save MusicMasterSongListCheck.txt: {e}")
@@ -861,30 +1211,43 @@ class JukeboxEngine:
                 self._log_error(f"Song file not found: {song_file_name}")
                 return False
 
-            if self.config['console']['show_system_info']:
+            if self._show_sysinfo and self._verbose:
+                import psutil
                 print("\nSystem Info:")
                 print(psutil.virtual_memory())
-                print("Garbage collection thresholds:", gc.get_threshold())
 
-            # Perform garbage collection
-            collected: int = gc.collect()
-            if self.config['console']['verbose']:
-                print(f"Garbage collector: collected {collected} objects.")
+            # Let the generational collector do its own work; only sweep the youngest
+            # generation every GC_THRESHOLD songs as a cheap safety net
+            self.gc_counter += 1
+            if self.gc_counter >= self.GC_THRESHOLD:
+                self.gc_counter = 0
+                collected: int = gc.collect(0)
+                if self._verbose:
+                    print(f"Garbage collector: collected {collected} objects.")
 
             # VLC Song Playback Code Begin
             try:
-                p: vlc.MediaPlayer = vlc_instance.media_player_new(song_file_name)
+                p: vlc.MediaPlayer = _get_vlc_instance().media_player_new(song_file_name)
+                import vlc  # already loaded (quietly) by _get_vlc_instance()
                 # Store player as instance variable for popup access
                 self.vlc_media_player = p
+
+                # Wait on VLC's own event thread instead of polling is_playing(), so the
+                # engine thread sleeps for the whole song and wakes as soon as it ends
+                song_finished: threading.Event = threading.Event()
+                event_manager = p.event_manager()
+                for event_type in (vlc.EventType.MediaPlayerEndReached,
+                                   vlc.EventType.MediaPlayerEncounteredError,
+                                   vlc.EventType.MediaPlayerStopped):
+                    event_manager.event_attach(event_type, lambda event: song_finished.set())
+
                 p.play()
-                if self.config['console']['verbose']:
-                    print('is_playing:', p.is_playing())  # 0 = False
-                time.sleep(self.SLEEP_TIME)  # sleep because it needs time to start playing
-                if self.config['console']['verbose']:
-                    print('is_playing:', p.is_playing())  # 1 = True
-
-                while p.is_playing():
-                    time.sleep(self.SLEEP_TIME)  # sleep to use less CPU
+
+                # Fallback check in case an end event is never delivered; the first check comes
+                # PLAYBACK_CHECK_INTERVAL after play(), well after VLC has started playing
+                while not song_finished.wait(self.PLAYBACK_CHECK_INTERVAL):
+                    if not p.is_playing():
+                        break
                 # VLC Song Playback Code End
                 return True
             except Exception as vlc_error:
@@ -903,47 +1266,24 @@ class JukeboxEngine:
         try:
             self._print_section("Loading Genre Configuration...")
 
-            extract_original_assigned_genres: List[str] = []
-            unfiltered_final_genre_list: List[str] = []
-
             try:
-                with open(self.genre_flags_file, 'r') as genre_flags_file:
-                    genre_flags_list: List[str] = json.load(genre_flags_file)
+                with open(self.genre_flags_file, 'rb') as genre_flags_file:
+                    genre_flags_list: List[str] = _json_loads(genre_flags_file.read())
             except (IOError, json.JSONDecodeError) as e:
                 self._log_error(f"Failed to load GenreFlagsList.txt: {e}")
                 genre_flags_list: List[str] = ['null', 'null', 'null', 'null']
 
-            self.genre0 = genre_flags_list[0] if len(genre_flags_list) > 0 else 'null'
-            self.genre1 = genre_flags_list[1] if len(genre_flags_list) > 1 else 'null'
-            self.genre2 = genre_flags_list[2] if len(genre_flags_list) > 2 else 'null'
-            self.genre3 = genre_flags_list[3] if len(genre_flags_list) > 3 else 'null'
+            self.genres = tuple((list(genre_flags_list) + ['null'] * 4)[:4])
+            self._active_genres = frozenset(genre for genre in self.genres if genre != 'null')
+            self._no_genre_filter = not self._active_genres
 
-            # Extract genres from all songs
-            for song in self.music_master_song_list:
-                try:
-                    extract_original_assigned_genres.append(song['comment'])
-                except KeyError:
-                    self._log_error(f"Missing 'comment' field in song: {song}")
-                    continue
-
-            # Split multi-genre selections
-            for genre_string in extract_original_assigned_genres:
-                if ' ' in genre_string:
-                    split_genres: List[str] = genre_string.split()
-                    extract_original_assigned_genres.extend(split_genres)
-
-            # Filter and create final genre list
-            for genre in extract_original_assigned_genres:
-                if ' ' not in genre:
-                    unfiltered_final_genre_list.append(genre)
-
-            self.final_genre_list = list(set(unfiltered_final_genre_list))  # removes duplicates
-            self.final_genre_list.sort()
+            # Every distinct genre word across all song comments (multi-genre comments split
+            # on whitespace) was already collected by _index_song_genres()
+            self.final_genre_list = sorted(self._genre_bits)
 
             # Print genre information
             print('\nGenres for Random Play:')
-            genres: List[str] = [self.genre0, self.genre1, self.genre2, self.genre3]
-            for idx, genre in enumerate(genres):
+            for idx, genre in enumerate(self.genres):
                 if genre == 'null':
                     print(f'  Genre {idx}: Not Set')
                 else:
@@ -963,69 +1303,86 @@ class JukeboxEngine:
         try:
             self._print_section("Generating Random Song Playlist...")
 
-            counter: int = 0
-            for song in self.music_master_song_list:
-                try:
-                    # Skip songs marked with 'norandom'
-                    if 'norandom' in song['comment']:
-                        counter += 1
-                        continue
-
-                    # Add all songs if no genre filters are set
-                    if (self.genre0 == "null" and self.genre1 == "null" and
-                        self.genre2 == "null" and self.genre3 == "null"):
-                        self.random_music_playlist.append(counter)
-                    else:
-                        # Add songs matching any of the genre filters
-                        if self.genre0 != "null" and self.genre0 in song['comment']:
-                            self.random_music_playlist.append(counter)
-                        elif self.genre1 != "null" and self.genre1 in song['comment']:
-                            self.random_music_playlist.append(counter)
-                        elif self.genre2 != "null" and self.genre2 in song['comment']:
-                            self.random_music_playlist.append(counter)
-                        elif self.genre3 != "null" and self.genre3 in song['comment']:
-                            self.random_music_playlist.append(counter)
-
-                    counter += 1
-                except KeyError as e:
-                    self._log_error(f"Missing key in song data: {e}")
-                    counter += 1
-                    continue
-
-            random.shuffle(self.random_music_playlist)
+            random_music_playlist: List[int] = list(self.random_music_playlist)
+            norandom_bit: int = self.NORANDOM_BIT
+            if self._no_genre_filter:
+                # Add all songs if no genre filters are set, skipping songs marked with 'norandom'
+                random_music_playlist.extend(
+                    index for index, mask in enumerate(self.song_genre_masks) if not mask & norandom_bit)
+            else:
+                # Add songs tagged with any of the genre filters, skipping songs marked with 'norandom'
+                active_mask: int = 0
+                for genre in self._active_genres:
+                    active_mask |= self._genre_bits.get(genre, 0)
+                random_music_playlist.extend(
+                    index for index, mask in enumerate(self.song_genre_masks)
+                    if mask & active_mask and not mask & norandom_bit)
+
+            # Shuffle as a list (deque indexing is O(n) away from the ends), then store as a deque
+            # so the playback loop can rotate the played song to the back in O(1)
+            random.shuffle(random_music_playlist)
+            self.random_music_playlist = deque(random_music_playlist)
             self._print_success(f"Generated random playlist with {len(self.random_music_playlist)} songs")
             return True
         except Exception as e:
             self._log_error(f"Unexpected error in generate_random_song_list: {e}")
             return False
 
+    def _print_now_playing(self, play_type: str, color: str) -> None:
+        """Print the Now Playing banner for the current song with a single write
+
+        Args:
+            play_type (str): Either 'PAID' or 'RANDOM'
+            color (str): Colors code used for the banner when colors are enabled
+        """
+        if sys.stdout is None:
+            return
+
+        if self._colors_on:
+            end: str = Colors.ENDC
+            banner: str = (f"\n{color}Now Playing ({play_type}): {Colors.BOLD}{self.song_name}{end}\n"
+                           f"{color}Artist: {self.artist_name}{end}\n"
+                           f"{color}Album: {self.album_name} ({self.song_year}){end}\n"
+                           f"{color}Duration: {self.song_duration} | Genre: {self.song_genre}{end}\n\n")
+        else:
+            banner: str = (f"\nNow Playing ({play_type}): {self.song_name}\n"
+                           f"Artist: {self.artist_name}\n"
+                           f"Album: {self.album_name} ({self.song_year})\n"
+                           f"Duration: {self.song_duration} | Genre: {self.song_genre}\n\n")
+        sys.stdout.write(banner)
+        sys.stdout.flush()
+
     def _log_song_play(self, artist: str, title: str, play_type: str) -> None:
         """Log a song play event to log file
 
+        The append is handed to the background file I/O worker so playback isn't held up.
+
         Args:
             artist (str): The artist name
             title (str): The song title
             play_type (str): Either 'Paid' or 'Random'
         """
-        try:
-            if self.config['logging']['enabled']:
-                with open(self.log_file, 'a') as log:
-                    now: datetime = self._get_rounded_timestamp()
-                    log.write('\n' + str(now) + ', ' + str(artist) + ' - ' + str(title) + ', Played ' + play_type + ',')
-        except IOError as e:
-            self._log_error(f"Failed to log song play: {e}")
+        if self._logging_on:
+            now: str = _rounded_timestamp_str()
+            file_io_queue.put({
+                'operation': 'append_log',
+                'path': self.log_file,
+                'line': '\n' + now + ', ' + str(artist) + ' - ' + str(title) + ', Played ' + play_type + ','
+            })
 
     def _write_current_song_playing(self, song_location: str) -> None:
         """Write current playing song location to file
 
+        The write is handed to the background file I/O worker so playback isn't held up.
+
         Args:
             song_location (str): The full path to the currently playing song
         """
-        try:
-            with open(self.current_song_playing_file, "w") as outfile:
-                outfile.write(song_location)
-        except IOError as e:
-            self._log_error(f"Failed to write CurrentSongPlaying.txt: {e}")
+        file_io_queue.put({
+            'operation': 'write_current_song',
+            'path': self.current_song_playing_file,
+            'content': song_location
+        })
 
     def jukebox_engine(self) -> bool:
         """
@@ -1054,42 +1411,39 @@ class JukeboxEngine:
                     try:
                         song_index: int = self.paid_music_playlist[0]
 
-                        if song_index >= len(self.music_master_song_list):
+                        if song_index >= len(self.song_locations):
                             self._log_error(f"Invalid song index in paid playlist: {song_index}")
                             del self.paid_music_playlist[0]
                             continue
 
-                        song: Dict[str, str] = self.music_master_song_list[song_index]
+                        if not self.assign_song_data('paid'):
+                            self._log_error("Failed to assign paid song data, skipping")
+                            break
 
-                        if self.config['console']['colors_enabled']:
-                            print(f"\n{Colors.BLUE}Now Playing (PAID): {Colors.BOLD}{song['title']}{Colors.ENDC}")
-                            print(f"{Colors.BLUE}Artist: {song['artist']}{Colors.ENDC}")
-                            print(f"{Colors.BLUE}Album: {song['album']} ({song['year']}){Colors.ENDC}")
-                            print(f"{Colors.BLUE}Duration: {song['duration']} | Genre: {song['comment']}{Colors.ENDC}\n")
-                        else:
-                            print(f"\nNow Playing (PAID): {song['title']}")
-                            print(f"Artist: {song['artist']}")
-                            print(f"Album: {song['album']} ({song['year']})")
-                            print(f"Duration: {song['duration']} | Genre: {song['comment']}\n")
+                        self._print_now_playing('PAID', Colors.BLUE)
 
                         # Save current playing song to disk
-                        self._write_current_song_playing(song['location'])
+                        self._write_current_song_playing(self.song_locations[song_index])
 
                         # Log paid song play
-                        self._log_song_play(song['artist'], song['title'], 'Paid')
+                        self._log_song_play(self.artist_name, self.song_name, 'Paid')
 
-                        if not self.play_song(song['location']):
-                            self._log_error(f"Failed to play paid song: {song['title']}")
+                        if not self.play_song(self.song_locations[song_index]):
+                            self._log_error(f"Failed to play paid song: {self.song_name}")
 
-                        # Re-read paid playlist from file before deleting to capture any new selections made while playing
+                        # Re-read paid playlist from file before deleting if a selection was saved while playing
                         # This prevents losing songs that were added during the song playback
-                        self.paid_music_playlist = read_paid_playlist(self.paid_music_playlist_file)
+                        if _paid_playlist_dirty.is_set():
+                            _paid_playlist_dirty.clear()
+                            self.paid_music_playlist = read_paid_playlist(self.paid_music_playlist_file)
 
                         # Delete song just played from paid playlist
                         try:
                             if self.paid_music_playlist:  # Only delete if there are songs in the list
                                 del self.paid_music_playlist[0]
                             write_paid_playlist(self.paid_music_playlist_file, self.paid_music_playlist)
+                            # Our own write isn't a new selection; the reload at the top of the loop sees any that raced it
+                            _paid_playlist_dirty.clear()
                         except (IOError, json.JSONDecodeError) as e:
                             self._log_error(f"Failed to update PaidMusicPlayList.txt: {e}")
                             break
@@ -1104,30 +1458,20 @@ class JukeboxEngine:
                             self._log_error("Failed to assign random song data, skipping")
                             break
 
-                        if self.config['console']['colors_enabled']:
-                            print(f"\n{Colors.GREEN}Now Playing (RANDOM): {Colors.BOLD}{self.song_name}{Colors.ENDC}")
-                            print(f"{Colors.GREEN}Artist: {self.artist_name}{Colors.ENDC}")
-                            print(f"{Colors.GREEN}Album: {self.album_name} ({self.song_year}){Colors.ENDC}")
-                            print(f"{Colors.GREEN}Duration: {self.song_duration} | Genre: {self.song_genre}{Colors.ENDC}\n")
-                        else:
-                            print(f"\nNow Playing (RANDOM): {self.song_name}")
-                            print(f"Artist: {self.artist_name}")
-                            print(f"Album: {self.album_name} ({self.song_year})")
-                            print(f"Duration: {self.song_duration} | Genre: {self.song_genre}\n")
+                        self._print_now_playing('RANDOM', Colors.GREEN)
 
                         # Save current playing song to disk
                         song_index: int = self.random_music_playlist[0]
-                        self._write_current_song_playing(self.music_master_song_list[song_index]['location'])
+                        self._write_current_song_playing(self.song_locations[song_index])
 
                         # Log random song play
                         self._log_song_play(self.artist_name, self.song_name, 'Random')
 
-                        if not self.play_song(self.music_master_song_list[song_index]['location']):
+                        if not self.play_song(self.song_locations[song_index]):
                             self._log_error(f"Failed to play random song: {self.song_name}")
 
                         # Move song to end of RandomMusicPlaylist
-                        move_first_list_element: int = self.random_music_playlist.pop(0)
-                        self.random_music_playlist.append(move_first_list_element)
+                        self.random_music_playlist.rotate(-1)
                         # Loop continues, goes back to check for paid songs again
                     except (KeyError, IndexError, TypeError) as e:
                         self._log_error(f"Error processing random song: {e}")
@@ -1151,7 +1495,7 @@ class JukeboxEngine:
 
                 # Count number of files in music directory
                 try:
-                    current_file_count: int = len(glob.glob(os.path.join(self.music_dir, '*.mp3')))
+                    current_file_count: int = sum(1 for _ in self._iter_mp3_files())
                     print(f"Current MP3 files in directory: {current_file_count}")
                 except Exception as e:
                     self._log_error(f"Failed to count MP3 files: {e}")
@@ -1159,8 +1503,8 @@ class JukeboxEngine:
 
                 # Open MusicMasterSongListCheck generated from previous run
                 try:
-                    with open(self.music_master_song_list_check_file, 'r') as check_file:
-                        stored_file_count: int = json.load(check_file)
+                    with open(self.music_master_song_list_check_file, 'rb') as check_file:
+                        stored_file_count: int = _json_loads(check_file.read())
                         print(f"Stored MP3 file count: {stored_file_count}")
                 except (IOError, json.JSONDecodeError) as e:
                     self._log_error(f"Failed to load MusicMasterSongListCheck.txt: {e}")
@@ -1171,15 +1515,21 @@ class JukeboxEngine:
                     self._print_success("Music database matches current files")
                     # Open MusicMasterSongList dictionary
                     try:
-                        with open(self.music_master_song_list_file, 'r') as master_list_file:
-                            self.music_master_song_list = json.load(master_list_file)
+                        music_master_song_list: List[Dict[str, str]] = _load_song_list(self.music_master_song_list_file)
+                        self._set_master_song_list(music_master_song_list)
+
+                        # Migrate a JSON song list to MessagePack once msgpack is installed
+                        if msgpack is not None and not _is_msgpack_file(self.music_master_song_list_file):
+                            with open(self.music_master_song_list_file, 'wb') as master_list_file:
+                                master_list_file.write(_song_list_dumps(music_master_song_list))
+                            self._print_success("Converted master song list to MessagePack")
 
                         # MusicMasterSongList matches, run required functions
                         if (self.assign_genres_to_random_play() and
                             self.generate_random_song_list()):
                             self._print_success("Engine initialization complete - ready for playback")
                             return
-                    except (IOError, json.JSONDecodeError) as e:
+                    except (IOError, KeyError, TypeError, ValueError) as e:
                         self._log_error(f"Failed to load MusicMasterSongList.txt: {e}")
                 else:
                     self._print_warning("Music database count mismatch - regenerating")
@@ -1202,38 +1552,75 @@ class JukeboxEngine:
 # SECTION 3B: FILE LOCKING HELPER FUNCTIONS FOR PAIDMUSICPLAYLIST.TXT
 # ============================================================================
 
+# Last parsed playlist per file, keyed by (mtime_ns, size, inode) so an unchanged file isn't re-parsed
+_paid_playlist_cache = {}
+
+# Set by write_paid_playlist whenever it replaces the file, so the engine knows a selection
+# may have been added while a song was playing
+_paid_playlist_dirty = threading.Event()
+
 def read_paid_playlist(filepath):
-    """Read PaidMusicPlayList.txt with retry logic to prevent race conditions"""
+    """Read PaidMusicPlayList.txt, retrying only while the file is locked
+
+    Returns a fresh list on every call (callers modify it), reusing the last parsed
+    contents while the file's mtime, size and inode are unchanged. write_paid_playlist
+    replaces the file atomically, so a parse error is never a half-written file and is
+    not retried; only a PermissionError from a Windows rename in progress is.
+    """
     max_retries = 5
     retry_delay = 0.01  # 10ms delay between retries
 
     for attempt in range(max_retries):
         try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
-            return data
+            file_stat = os.stat(filepath)
+            file_key = (file_stat.st_mtime_ns, file_stat.st_size, file_stat.st_ino)
+            cached = _paid_playlist_cache.get(filepath)
+            if cached is not None and cached[0] == file_key:
+                return list(cached[1])
+            with open(filepath, 'rb') as f:
+                data = _json_loads(f.read())
+            if not isinstance(data, list):
+                return []
+            _paid_playlist_cache[filepath] = (file_key, data)
+            return list(data)
         except FileNotFoundError:
             return []
-        except (IOError, json.JSONDecodeError) as e:
+        except PermissionError:
             if attempt < max_retries - 1:
                 time.sleep(retry_delay)
-            else:
-                return []
+        except ValueError as e:
+            print(f"Error parsing PaidMusicPlayList.txt: {e}")
+            return []
+        except IOError:
+            return []
     return []
 
 def write_paid_playlist(filepath, data):
-    """Write PaidMusicPlayList.txt with atomic operations and retry logic to prevent race conditions"""
+    """Write PaidMusicPlayList.txt with atomic operations and retry logic to prevent race conditions
+
+    Nothing is written when the file already holds exactly the same contents.
+    """
     max_retries = 5
     retry_delay = 0.01  # 10ms delay between retries
+    payload = _json_dumps(data)
+
+    # Skip the temp file and rename when the file already holds this playlist
+    try:
+        with open(filepath, 'rb') as f:
+            if f.read(len(payload) + 1) == payload:
+                return True
+    except (IOError, OSError):
+        pass
 
     for attempt in range(max_retries):
         try:
             # Write to temp file first, then rename (atomic operation)
             temp_filepath = filepath + '.tmp'
-            with open(temp_filepath, 'w') as f:
-                json.dump(data, f)
+            with open(temp_filepath, 'wb') as f:
+                f.write(payload)
             # Atomic rename on Windows
             os.replace(temp_filepath, filepath)
+            _paid_playlist_dirty.set()
             return True
         except (IOError, OSError) as e:
             if attempt < max_retries - 1:
@@ -1259,17 +1646,20 @@ def create_vlc_player_silent(file_path):
     VLC prints errors at the C library level (not Python level), so we need to redirect
     file descriptors 2 (stderr) and 1 (stdout) at the OS level to suppress the messages.
     """
+    # Resolve the shared instance first: _get_vlc_instance() swaps fd 2 itself under its lock,
+    # so it must not run while this function has fd 2 redirected
+    instance = _get_vlc_instance()
+
     # Save original file descriptors
     old_stdout = os.dup(1)  # stdout file descriptor
     old_stderr = os.dup(2)  # stderr file descriptor
 
     try:
-        # Redirect stdout and stderr to /dev/null using file descriptors
-        with open(os.devnull, 'w') as devnull:
-            os.dup2(devnull.fileno(), 1)  # Redirect stdout
-            os.dup2(devnull.fileno(), 2)  # Redirect stderr
-            # Create VLC player (this will now produce no output)
-            player = vlc_instance.media_player_new(file_path)
+        # Redirect stdout and stderr to the cached /dev/null descriptor
+        os.dup2(_DEVNULL_FD, 1)  # Redirect stdout
+        os.dup2(_DEVNULL_FD, 2)  # Redirect stderr
+        # Create VLC player (this will now produce no output)
+        player = instance.media_player_new(file_path)
     finally:
         # Always restore original file descriptors
         os.dup2(old_stdout, 1)
@@ -1279,6 +1669,17 @@ def create_vlc_player_silent(file_path):
 
     return player
 
+# Single MediaPlayer reused for every buzz, created on the first buzz (VLC is loaded lazily)
+_buzz_player = None
+
+def play_buzz():
+    """Play the buzz sound effect from the start, reusing one VLC MediaPlayer"""
+    global _buzz_player
+    if _buzz_player is None:
+        _buzz_player = create_vlc_player_silent('jukebox_required_audio_files/buzz.mp3')
+    _buzz_player.stop()
+    _buzz_player.play()
+
 global selection_window_number
 global jukebox_selection_window
 global last_song_check
@@ -1301,29 +1702,36 @@ global song_start_time
 global last_displayed_time
 rotating_record_rotation_stop_flag = None
 rotating_record_start_time = None
-last_keypress_time = time.time()
+# Set by the pygame thread once the rotating record window has closed
+rotating_record_done = None
+# Idle and song timers use the monotonic clock so a wall-clock change (NTP, DST) can't skew them
+last_keypress_time = time.monotonic()
 last_displayed_time = ""
-song_start_time = time.time()
+song_start_time = time.monotonic()
 UpcomingSongPlayList = []
-all_songs_list = []
 all_artists_list = []
 find_list = []
 MusicMasterSongList = []
-MusicMasterSongDict = []
 master_songlist_number = 0
+# Number of the song shown in A1 on the last selection screen (the final 21 songs)
+last_selection_window_number = 0
+# Selection screen currently drawn on the 21 buttons, None until the first redraw
+global painted_selection_window_number
+painted_selection_window_number = None
+search_indexes = None
+# Song number by file location, and by the 22-character title and artist shown on the selection buttons
+song_location_index = {}
+song_title_artist_index = {}
 dir_path = os.path.dirname(os.path.realpath(__file__))
 #  Check for files on disk. If they dont exist, create them
 #  Create date and time stamp for log file
-now = datetime.now()
-rounded_now = now + timedelta(seconds=0.5)
-rounded_now = rounded_now.replace(microsecond=0)
-now = rounded_now
+now = _rounded_timestamp_str()
 if not os.path.exists('log.txt'):
     with open('log.txt', 'w') as log:
-        log.write(str(now) + ' Jukebox GUI Started - New Log File Created,')
+        log.write(now + ' Jukebox GUI Started - New Log File Created,')
 else:
     with open('log.txt', 'a') as log:
-        log.write('\n' + str(now) + ', Jukebox GUI Restarted,')
+        log.write('\n' + now + ', Jukebox GUI Restarted,')
 if not os.path.exists('the_bands.txt'):
     with open('the_bands.txt', 'w') as TheBandsTextOpen:
         # Band names to have the added to them, in lower case separated by commas in thebands.txt file
@@ -1349,66 +1757,93 @@ if not os.path.exists('YearRangeLabelList.txt'):
 # This code is deferred until after the jukebox engine generates the MusicMasterSongList.txt file
 def _load_master_song_list():
     """Load and process master song list after it has been generated"""
-    global all_songs_list, all_artists_list, find_list, MusicMasterSongList, MusicMasterSongDict, master_songlist_number
-
-    with open('MusicMasterSongList.txt', 'r') as MusicMasterSongListOpen:
-        MusicMasterSongList = json.load(MusicMasterSongListOpen)
-    #  sort MusicMasterSongList dictionary by artist
-    MusicMasterSongList = sorted(MusicMasterSongList, key=itemgetter('artist'))
-    with open('MusicMasterSongList.txt', 'r') as MusicMasterSongListOpen:
-        MusicMasterSongList = json.load(MusicMasterSongListOpen)
-    #  sort MusicMasterSongList dictionary by artist
-    MusicMasterSongDict = sorted(MusicMasterSongList, key=itemgetter('artist'))
-    # MusicMasterSongList*=0
-    master_songlist_number = len(MusicMasterSongDict)
-    counter = 0
-    for counter in range(master_songlist_number):
-        all_songs_list.append(list(MusicMasterSongDict[counter].values()))
-    MusicMasterSongDict*=0
-    artist_songlist_number = len(all_songs_list)
-    counter = 0
-    for counter in range(artist_songlist_number):
-        all_artists_list.append(all_songs_list[counter][3])
-    all_songs_list*=0
-    # Important Delete duplicates from all_artists_list
-    all_artists_list = list(set(all_artists_list)) # https://bit.ly/4cZ7A6R
-    # Sort all_artists_list
-    all_artists_list = sorted(all_artists_list)
+    global all_artists_list, find_list, MusicMasterSongList, master_songlist_number, last_selection_window_number, search_indexes
+    global song_location_index, song_title_artist_index
+
+    # Kept in file order - the list position is the song number used by the paid playlist
+    MusicMasterSongList = _load_song_list('MusicMasterSongList.txt')
+    master_songlist_number = len(MusicMasterSongList)
+    last_selection_window_number = master_songlist_number - 21
+    # Unique artists (duplicates removed by the set), sorted, in one pass over the song list
+    all_artists_list = sorted(set(map(itemgetter('artist'), MusicMasterSongList)))
     find_list = all_artists_list
+    # Result label/artist lookups and prefix indexes for the search window, so neither typing nor a clicked result scans the list
+    search_indexes = build_search_indexes(MusicMasterSongList)
+    # First song for each location and truncated title/artist, so the GUI never scans the list for them
+    song_location_index = {}
+    song_title_artist_index = {}
+    for number, song in enumerate(MusicMasterSongList):
+        song_location_index.setdefault(song['location'], number)
+        song_title_artist_index.setdefault((str(song['title'][:22]), str(song['artist'][:22])), number)
 
 # Queue and thread for handling file I/O operations to prevent event loop freezing
 file_io_queue = Queue()
 
 def file_io_worker_thread():
-    """Background thread to handle non-blocking file I/O operations"""
+    """Background thread to handle non-blocking file I/O operations
+
+    Waits for a task, then drains everything else already queued and handles the
+    whole burst at once, so rapid selections cost one write per file rather than one each.
+    """
+    log_handles = {}  # Line-buffered append handle per log file, opened on first use
     while True:
         try:
-            task = file_io_queue.get(timeout=1)
-            if task is None:  # Signal to exit thread
-                break
+            batch = [file_io_queue.get()]
+            while True:
+                try:
+                    batch.append(file_io_queue.get_nowait())
+                except Empty:
+                    break
 
-            operation = task.get('operation')
+            # Each save is a full rewrite of PaidMusicPlayList or CurrentSongPlaying, so only the last
+            # one per file matters; log lines are collected so each log file is appended to once
+            latest_paid_playlists = {}
+            latest_current_songs = {}
+            log_lines = {}
+            stop_requested = False
+            for task in batch:
+                if task is None:  # Signal to exit thread
+                    stop_requested = True
+                    break
+
+                operation = task.get('operation')
 
+                if operation == 'save_song_selection':
+                    # NOTE: This assumes the GUI has properly prepared the list
+                    latest_paid_playlists[task.get('paid_music_file_path')] = task.get('PaidMusicPlayList')
+                elif operation == 'write_current_song':
+                    latest_current_songs[task.get('path')] = task.get('content')
+                elif operation == 'append_log':
+                    log_lines.setdefault(task.get('path'), []).append(task.get('line'))
 
-            if operation == 'save_song_selection':
-                paid_music_file_path = task.get('paid_music_file_path')
-                PaidMusicPlayList = task.get('PaidMusicPlayList')
-                song_info = task.get('song_info')  # tuple of (artist, title)
+            # Write updated PaidMusicPlayList to disk (temp file + atomic rename)
+            for paid_music_file_path, PaidMusicPlayList in latest_paid_playlists.items():
+                write_paid_playlist(paid_music_file_path, PaidMusicPlayList)
 
+            for current_song_file_path, song_location in latest_current_songs.items():
                 try:
-                    # Write updated PaidMusicPlayList to disk
-                    # NOTE: This assumes the GUI has properly prepared the list
-                    with open(paid_music_file_path, 'w') as f:
-                        json.dump(PaidMusicPlayList, f)
+                    with open(current_song_file_path, 'w') as f:
+                        f.write(song_location)
                 except IOError as e:
-                    print(f'Background thread error writing files: {e}')
+                    print(f'Background thread error writing CurrentSongPlaying.txt: {e}')
 
-        except Empty:
-            # Queue timeout is normal - just continue waiting for tasks
-            continue
+            for log_file_path, lines in log_lines.items():
+                try:
+                    log_handle = log_handles.get(log_file_path)
+                    if log_handle is None:
+                        log_handle = log_handles[log_file_path] = open(log_file_path, 'a', buffering=1)
+                    log_handle.write(''.join(lines))
+                except IOError as e:
+                    print(f'Background thread error writing log file: {e}')
+
+            if stop_requested:
+                break
         except Exception as e:
             print(f'File I/O worker thread error: {e}')
 
+    for log_handle in log_handles.values():
+        log_handle.close()
+
 # Start the background file I/O worker thread
 file_io_worker = threading.Thread(target=file_io_worker_thread, daemon=True)
 file_io_worker.start()
@@ -1427,6 +1862,43 @@ def title_bar(title, text_color, background_color):
     return [sg.Col([]),
                 sg.Col([[sg.T(),sg.Text()]],element_justification='r', key='--BG--')]
 
+# Print every GUI event and its values to the console (formatting the values dict is costly, so off by default)
+DEBUG = False
+
+# Selection entry ("A1".."C7") -> (selection button key, top title button key, bottom title button key)
+SELECTION_ENTRY_MAP = {
+    f"{letter}{number}": (f"--{letter}{number}--", f"--button{i}_top--", f"--button{i}_bottom--")
+    for i, (letter, number) in enumerate((letter, number) for letter in "ABC" for number in range(1, 8))
+}
+
+# Keys of the 42 selection title/artist buttons whose fonts are reset and resized on every redraw
+FONT_SIZE_WINDOW_UPDATES = create_font_size_window_updates()
+
+# Keypress events that close the rotating record popup (ESC, or 'x' pressed on the selection popup)
+POPUP_CLOSE_EVENTS = frozenset(['--ESC--', '--POPUP_X_PRESSED--'])
+
+# Keys of the numbered (1-7) and lettered (A-C) selection buttons in the control button window
+NUMBERED_BUTTON_KEYS = tuple(f'--{number}--' for number in range(1, 8))
+LETTER_BUTTON_KEYS = ('--A--', '--B--', '--C--')
+# Letter button or key event -> the selection letter it enters
+LETTER_EVENT_MAP = {'--A--': 'A', 'a': 'A', '--B--': 'B', 'b': 'B', '--C--': 'C', 'c': 'C'}
+# Number button or key event -> the selection number it enters
+NUMBER_EVENT_MAP = {**{key: str(number) for number, key in enumerate(NUMBERED_BUTTON_KEYS, start=1)},
+                    **{str(number): str(number) for number in range(1, 8)}}
+
+# Arrow key/button events that page the selection screen by 21 songs
+ARROW_EVENTS = frozenset(['--selection_right--', 'Right:39', '--selection_left--', 'Left:37'])
+
+# Arrow presses are coalesced and the selection screen redrawn at most once per this many seconds
+SELECTION_REDRAW_DELAY = 0.05
+
+# Events that count as user activity and reset the rotating record popup's idle timer
+IDLE_RESET_EVENTS = POPUP_CLOSE_EVENTS | ARROW_EVENTS | frozenset([
+    'T', 'A',  # Title and artist search
+    'x',  # Credit
+    '--select--', 'S',
+]) | frozenset(LETTER_EVENT_MAP) | frozenset(NUMBER_EVENT_MAP)
+
 
 # ============================================================================
 # SECTION 5: MAIN GUI FUNCTION
@@ -1446,37 +1918,34 @@ def main():
         # Call the compacted disable_c_selection_buttons function from external module
         disable_c_buttons_module(jukebox_selection_window, control_button_window)
     def disable_numbered_selection_buttons():
-        #  Identify all buttons to be disabled in the numbered selection window
-        control_buttons_to_disable = ['--1--', '--2--', '--3--', '--4--', '--5--', '--6--', '--7--']
-        #  Loop through all buttons to disable them in the C selection window
-        for control_buttons in control_buttons_to_disable:
-            control_button_window[control_buttons].update(disabled=True)
+        #  Disable the 1-7 buttons in the control window
+        for numbered_button in numbered_buttons:
+            set_disabled(numbered_button, True)
     def selection_buttons_update(selection_window_number):
         #  stop screen progression at end of list
-        if selection_window_number + 20 >= len(MusicMasterSongList):
-            selection_window_number = len(MusicMasterSongList)-21
-            right_arrow_selection_window['--selection_right--'].update(disabled=True)
-            #VLC Song Playback Code Begin
-            p = create_vlc_player_silent('jukebox_required_audio_files/buzz.mp3')
-            p.play()
+        if selection_window_number + 20 >= master_songlist_number:
+            selection_window_number = last_selection_window_number
+            set_disabled(right_arrow_button, True)
+            play_buzz()
         else:
-            right_arrow_selection_window['--selection_right--'].update(disabled=False)
+            set_disabled(right_arrow_button, False)
         #  Stop screen progression at beginning of list
         if selection_window_number + 20 < 0:
             selection_window_number = 0
-            left_arrow_selection_window['--selection_left--'].update(disabled=True)
-            #VLC Song Playback Code Begin
-            p = create_vlc_player_silent('jukebox_required_audio_files/buzz.mp3')
-            p.play()
+            set_disabled(left_arrow_button, True)
+            play_buzz()
         else:
-            left_arrow_selection_window['--selection_left--'].update(disabled=False)
-        #  update window buttons        
-        font_size_window_updates = create_font_size_window_updates()        
+            set_disabled(left_arrow_button, False)
+        #  The buttons already show this screen (e.g. arrow pressed at either end of the list) - nothing to redraw
+        global painted_selection_window_number
+        if selection_window_number == painted_selection_window_number:
+            return
         #  Update and restore selection window buttons to standard font size, then update with song data
-        reset_button_fonts(jukebox_selection_window, font_size_window_updates)
+        reset_button_fonts(jukebox_selection_window, FONT_SIZE_WINDOW_UPDATES)
         update_selection_button_text(jukebox_selection_window, MusicMasterSongList, selection_window_number)
-        adjust_button_fonts_by_length(jukebox_selection_window, font_size_window_updates)
+        adjust_button_fonts_by_length(jukebox_selection_window, FONT_SIZE_WINDOW_UPDATES)
         the_bands_name_check()
+        painted_selection_window_number = selection_window_number
     def band_names_exemptions(the_band_to_update, exempted_bands, band_to_check):
         """Check if band needs exemption from 'The' prefix"""
         if the_band_to_update in exempted_bands:
@@ -1487,10 +1956,16 @@ def main():
         # Call the compacted the_bands_name_check function from external module
         check_bands_module(jukebox_selection_window, dir_path, band_names_exemptions)
 
+    # Selection letter -> the functions disabling the other two letters' buttons
+    other_letter_disablers = {
+        "A": (disable_b_selection_buttons, disable_c_selection_buttons),
+        "B": (disable_a_selection_buttons, disable_c_selection_buttons),
+        "C": (disable_a_selection_buttons, disable_b_selection_buttons),
+    }
+
     def enable_numbered_selection_buttons():
-        buttons_to_disable = ['--1--', '--2--', '--3--', '--4--', '--5--', '--6--', '--7--']
-        for buttons in buttons_to_disable:
-            control_button_window[buttons].update(disabled=False)
+        for numbered_button in numbered_buttons:
+            set_disabled(numbered_button, False)
     def enable_all_buttons():
         # Call the compacted enable_all_buttons function from external module
         enable_all_buttons_module(jukebox_selection_window, control_button_window) 
@@ -1501,95 +1976,38 @@ def main():
         disable_b_selection_buttons()
         disable_c_selection_buttons()
         disable_numbered_selection_buttons()
-        if selection_entry == "A1":
-            jukebox_selection_window['--A1--'].update(disabled=False)
-            jukebox_selection_window['--button0_top--'].update(disabled=False)
-            jukebox_selection_window['--button0_bottom--'].update(disabled=False)
-        if selection_entry == "A2":
-            jukebox_selection_window['--A2--'].update(disabled=False)
-            jukebox_selection_window['--button1_top--'].update(disabled=False)
-            jukebox_selection_window['--button1_bottom--'].update(disabled=False)
-        if selection_entry == "A3":
-            jukebox_selection_window['--A3--'].update(disabled=False)
-            jukebox_selection_window['--button2_top--'].update(disabled=False)
-            jukebox_selection_window['--button2_bottom--'].update(disabled=False)
-        if selection_entry == "A4":
-            jukebox_selection_window['--A4--'].update(disabled=False)
-            jukebox_selection_window['--button3_top--'].update(disabled=False)
-            jukebox_selection_window['--button3_bottom--'].update(disabled=False)
-        if selection_entry == "A5":
-            jukebox_selection_window['--A5--'].update(disabled=False)
-            jukebox_selection_window['--button4_top--'].update(disabled=False)
-            jukebox_selection_window['--button4_bottom--'].update(disabled=False)
-        if selection_entry == "A6":
-            jukebox_selection_window['--A6--'].update(disabled=False)
-            jukebox_selection_window['--button5_top--'].update(disabled=False)
-            jukebox_selection_window['--button5_bottom--'].update(disabled=False)
-        if selection_entry == "A7":
-            jukebox_selection_window['--A7--'].update(disabled=False)
-            jukebox_selection_window['--button6_top--'].update(disabled=False)
-            jukebox_selection_window['--button6_bottom--'].update(disabled=False)
-        if selection_entry == "B1":
-            jukebox_selection_window['--B1--'].update(disabled=False)
-            jukebox_selection_window['--button7_top--'].update(disabled=False)
-            jukebox_selection_window['--button7_bottom--'].update(disabled=False)
-        if selection_entry == "B2":
-            jukebox_selection_window['--B2--'].update(disabled=False)
-            jukebox_selection_window['--button8_top--'].update(disabled=False)
-            jukebox_selection_window['--button8_bottom--'].update(disabled=False)
-        if selection_entry == "B3":
-            jukebox_selection_window['--B3--'].update(disabled=False)
-            jukebox_selection_window['--button9_top--'].update(disabled=False)
-            jukebox_selection_window['--button9_bottom--'].update(disabled=False)
-        if selection_entry == "B4":
-            jukebox_selection_window['--B4--'].update(disabled=False)
-            jukebox_selection_window['--button10_top--'].update(disabled=False)
-            jukebox_selection_window['--button10_bottom--'].update(disabled=False)
-        if selection_entry == "B5":
-            jukebox_selection_window['--B5--'].update(disabled=False)
-            jukebox_selection_window['--button11_top--'].update(disabled=False)
-            jukebox_selection_window['--button11_bottom--'].update(disabled=False)
-        if selection_entry == "B6":
-            jukebox_selection_window['--B6--'].update(disabled=False)
-            jukebox_selection_window['--button12_top--'].update(disabled=False)
-            jukebox_selection_window['--button12_bottom--'].update(disabled=False)
-        if selection_entry == "B7":
-            jukebox_selection_window['--B7--'].update(disabled=False)
-            jukebox_selection_window['--button13_top--'].update(disabled=False)
-            jukebox_selection_window['--button13_bottom--'].update(disabled=False)
-        if selection_entry == "C1":
-            jukebox_selection_window['--C1--'].update(disabled=False)
-            jukebox_selection_window['--button14_top--'].update(disabled=False)
-            jukebox_selection_window['--button14_bottom--'].update(disabled=False)
-        if selection_entry == "C2":
-            jukebox_selection_window['--C2--'].update(disabled=False)
-            jukebox_selection_window['--button15_top--'].update(disabled=False)
-            jukebox_selection_window['--button15_bottom--'].update(disabled=False)
-        if selection_entry == "C3":
-            jukebox_selection_window['--C3--'].update(disabled=False)
-            jukebox_selection_window['--button16_top--'].update(disabled=False)
-            jukebox_selection_window['--button16_bottom--'].update(disabled=False)
-        if selection_entry == "C4":
-            jukebox_selection_window['--C4--'].update(disabled=False)
-            jukebox_selection_window['--button17_top--'].update(disabled=False)
-            jukebox_selection_window['--button17_bottom--'].update(disabled=False)
-        if selection_entry == "C5":
-            jukebox_selection_window['--C5--'].update(disabled=False)
-            jukebox_selection_window['--button18_top--'].update(disabled=False)
-            jukebox_selection_window['--button18_bottom--'].update(disabled=False)
-        if selection_entry == "C6":
-            jukebox_selection_window['--C6--'].update(disabled=False)
-            jukebox_selection_window['--button19_top--'].update(disabled=False)
-            jukebox_selection_window['--button19_bottom--'].update(disabled=False)
-        if selection_entry == "C7":
-            jukebox_selection_window['--C7--'].update(disabled=False)
-            jukebox_selection_window['--button20_top--'].update(disabled=False)
-            jukebox_selection_window['--button20_bottom--'].update(disabled=False)
-        control_button_window['--select--'].update(disabled=False)
+        # Re-enable only the chosen selection and its two title buttons
+        for element in selection_entry_elements.get(selection_entry, ()):
+            set_disabled(element, False)
+        set_disabled(select_button, False)
         return selection_entry
     # Call the compacted upcoming selections update function
     def upcoming_selections_update():
         update_upcoming_selections(info_screen_window, UpcomingSongPlayList)
+    # Close the rotating record popup if it is showing - the flag is cleared first so a second call does nothing
+    def close_rotating_record_popup(restore_windows=True):
+        global rotating_record_rotation_stop_flag, rotating_record_start_time, rotating_record_done
+        if rotating_record_rotation_stop_flag is None:
+            return
+        rotation_stop_flag = rotating_record_rotation_stop_flag
+        rotating_record_rotation_stop_flag = None
+        rotating_record_start_time = None
+        try:
+            from popup_rotating_record_code_module import log_popup_event
+            log_popup_event("popup window rotating closed")
+            # Already set when pygame closed the popup itself on a keypress
+            if not rotation_stop_flag.is_set():
+                rotation_stop_flag.set()
+                # Before restoring the selector windows, wait for the pygame window to go - returns as soon
+                # as it has, 0.2s at most. With nothing to restore the pygame thread just shuts down on its own
+                if restore_windows:
+                    rotating_record_done.wait(timeout=0.2)
+            rotating_record_done = None
+            if restore_windows:
+                # Restore selector windows (background, info_screen, and arrow windows stay visible)
+                unhide_windows(selector_windows)
+        except Exception as e:
+            pass
     #  essential code for background image placement and transparent windows placed overtop from https://www.pysimplegui.org/en/latest/Demos/#demo_window_background_imagepy
     background_layout = [[sg.Image(data=background_image)]]
     window_background = sg.Window('Background', background_layout, return_keyboard_events=True, use_default_focus=False, no_titlebar=True, finalize=True, margins=(0, 0),
@@ -1623,61 +2041,68 @@ def main():
                 keep_on_top=True, transparent_color=sg.theme_background_color(), no_titlebar=True,return_keyboard_events=True, use_default_focus=False, element_padding=((0, 0), (0, 0)), relative_location=(150, 306))
     song_playing_lookup_window = sg.Window('Song Playing Lookup Thread', song_playing_lookup_layout, no_titlebar=True, finalize=True,return_keyboard_events=True, use_default_focus=False)
 
+    # Look up the elements touched on every keypress once, rather than by key on each event
+    numbered_buttons = tuple(control_button_window[key] for key in NUMBERED_BUTTON_KEYS)
+    letter_buttons = [control_button_window[key] for key in LETTER_BUTTON_KEYS]
+    select_button = control_button_window['--select--']
+    right_arrow_button = right_arrow_selection_window['--selection_right--']
+    left_arrow_button = left_arrow_selection_window['--selection_left--']
+    credits_text = info_screen_window['--credits--']
+    selection_entry_elements = {entry: tuple(jukebox_selection_window[key] for key in keys)
+                                for entry, keys in SELECTION_ENTRY_MAP.items()}
+    # Number pressed -> the A, B and C selections (with title buttons) in that row, plus the A/B/C buttons
+    number_row_elements = {str(number): [element for letter in "ABC" for element in selection_entry_elements[f"{letter}{number}"]] + letter_buttons
+                           for number in range(1, 8)}
+    # Selector windows hidden while the rotating record popup shows (background, info and arrows stay up)
+    selector_windows = (jukebox_selection_window, control_button_window, song_playing_lookup_window)
+
     # Bind ESC key to all main windows for exit functionality
-    window_background.bind('<Escape>', '--ESC--')
-    right_arrow_selection_window.bind('<Escape>', '--ESC--')
-    left_arrow_selection_window.bind('<Escape>', '--ESC--')
-    jukebox_selection_window.bind('<Escape>', '--ESC--')
-    info_screen_window.bind('<Escape>', '--ESC--')
-    control_button_window.bind('<Escape>', '--ESC--')
-    song_playing_lookup_window.bind('<Escape>', '--ESC--')
+    for main_window in (window_background, right_arrow_selection_window, left_arrow_selection_window, jukebox_selection_window,
+                        info_screen_window, control_button_window, song_playing_lookup_window):
+        main_window.bind('<Escape>', '--ESC--')
 
     the_bands_name_check()
     threading.Thread(target=file_lookup_thread, args=(song_playing_lookup_window,), daemon=True).start()
+    # Time of the first arrow press not yet drawn on the selection screen, None when it is up to date
+    selection_redraw_pending_since = None
+    # CurrentSongPlaying.txt contents, the (mtime, size) they were read at, and the song shown on the info screen
+    song_currently_playing = ""
+    last_current_song_version = None
+    info_screen_song_number = None
     # Main Jukebox GUI
     while True:
-        global last_keypress_time, rotating_record_rotation_stop_flag, rotating_record_start_time
-        window, event, values = sg.read_all_windows(timeout=100)  # 100ms timeout for smooth countdown updates
-        print(event, values)
-        print(event)  # prints buttons key name
+        global last_keypress_time, rotating_record_rotation_stop_flag, rotating_record_start_time, rotating_record_done
+        # Block until an event arrives - the countdown is driven by the once-a-second song lookup event, and
+        # popup timeouts and pygame popup closes post their own events - except while an arrow press is waiting to be drawn
+        read_timeout = int(SELECTION_REDRAW_DELAY * 1000) if selection_redraw_pending_since is not None else None
+        window, event, values = sg.read_all_windows(timeout=read_timeout)
+        # One monotonic clock read per event, shared by the idle timer and redraw checks
+        now = time.monotonic()
+        if DEBUG:
+            console_log(f'{event} {values}')
+            console_log(event)  # prints buttons key name
+
+        # Draw the selection screen once per burst of arrow presses, and always before any other event
+        # is handled so it never acts on a stale screen
+        if selection_redraw_pending_since is not None and (
+                event not in ARROW_EVENTS or now - selection_redraw_pending_since >= SELECTION_REDRAW_DELAY):
+            selection_buttons_update(selection_window_number)
+            selection_redraw_pending_since = None
 
         # KEYPRESS HANDLING FOR ROTATING RECORD POPUP
-        # Reset idle timer on any keypress (except timeout events)
-        if event and event not in [None, sg.TIMEOUT_KEY, '--SONG_PLAYING_LOOKUP--']:
-            # Check if it's a keypress event (starts with special prefixes)
-            if event.startswith('--') and ('KEY' in event or 'PRESSED' in event or event == '--ESC--'):
-                last_keypress_time = time.time()
+        # Reset idle timer on any user keypress or button press (for rotating record popup)
+        if event in IDLE_RESET_EVENTS:
+            last_keypress_time = now
 
+            if event in POPUP_CLOSE_EVENTS:
                 # Close rotating record popup on any keypress
-                if rotating_record_rotation_stop_flag is not None:
-                    try:
-                        rotating_record_rotation_stop_flag.set()
-                        log_popup_event("popup window rotating closed")
-                        # Wait for pygame thread to finish closing
-                        time.sleep(0.2)  # Give popup thread time to clean up
-                        rotating_record_rotation_stop_flag = None
-                        rotating_record_start_time = None
-                        # Restore selector windows after keypress close (background, info_screen, and arrow windows stay visible)
-                        jukebox_selection_window.UnHide()
-                        control_button_window.UnHide()
-                        song_playing_lookup_window.UnHide()
-                    except Exception as e:
-                        pass
+                close_rotating_record_popup()
 
-        # Check if pygame closed the popup via keypress (rotation_stop_flag was set)
+        # Check if pygame closed the popup via keypress (rotation_stop_flag was set and '--ROTATING_RECORD_CLOSED--' posted)
         if rotating_record_rotation_stop_flag is not None and rotating_record_rotation_stop_flag.is_set():
-            try:
-                log_popup_event("popup window rotating closed")
-                rotating_record_rotation_stop_flag = None
-                rotating_record_start_time = None
-                # Reset idle timer so popup won't reappear for 20 seconds
-                last_keypress_time = time.time()
-                # Restore selector windows (background, info_screen, and arrow windows stay visible)
-                jukebox_selection_window.UnHide()
-                control_button_window.UnHide()
-                song_playing_lookup_window.UnHide()
-            except Exception as e:
-                pass
+            # Reset idle timer so popup won't reappear for 20 seconds
+            last_keypress_time = now
+            close_rotating_record_popup()
 
         # Handle ESC key to exit program
         if event == '--ESC--':
@@ -1685,7 +2110,8 @@ def main():
 
         # Handle popup window events
         if active_popup_window is not None:
-            # Check if popup has exceeded 3 second duration
+            # Check if popup has exceeded 3 second duration (a '--POPUP_TIMEOUT--' event is posted when it's due)
+            # popup_start_time comes from time.time() in the popup module
             if popup_start_time is not None and time.time() - popup_start_time >= popup_duration:
                 try:
                     active_popup_window.close()
@@ -1697,11 +2123,9 @@ def main():
 
             # Handle 'x' key press on popup - add one credit
             if event == '--POPUP_X_PRESSED--':
-                # Reset idle timer when credit key is pressed in popup (for rotating record popup)
-                last_keypress_time = time.time()
                 credit_amount += 1
-                info_screen_window['--credits--'].Update('CREDITS ' + str(credit_amount))
-                print(f"Credit added via popup! Total credits: {credit_amount}")
+                credits_text.Update('CREDITS ' + str(credit_amount))
+                console_log(f"Credit added via popup! Total credits: {credit_amount}")
 
             # Handle ESC on popup - close it
             if event == '--POPUP_ESC--':
@@ -1714,20 +2138,15 @@ def main():
                     pass
 
         if (event) == "--selection_right--" or (event) == 'Right:39':
-            # Reset idle timer when arrow key is pressed (for rotating record popup)
-            last_keypress_time = time.time()
             selection_window_number = selection_window_number + 21
-            selection_buttons_update(selection_window_number)
+            if selection_redraw_pending_since is None:
+                selection_redraw_pending_since = now
         if (event) == "--selection_left--" or (event) == 'Left:37':
-            # Reset idle timer when arrow key is pressed (for rotating record popup)
-            last_keypress_time = time.time()
             selection_window_number = selection_window_number - 21
-            selection_buttons_update(selection_window_number)
+            if selection_redraw_pending_since is None:
+                selection_redraw_pending_since = now
         # Code to initiate search for title or artist
         if (event) == "T" or (event) == "A":
-            # Reset idle timer when search keys are pressed (for rotating record popup)
-            last_keypress_time = time.time()
-
             # Determine search type
             if (event) == "T":
                 search_type = "title"
@@ -1759,7 +2178,8 @@ def main():
                 MusicMasterSongList,
                 all_artists_list,
                 main_windows,
-                callback_functions
+                callback_functions,
+                search_indexes
             )
 
             # Handle search result
@@ -1770,204 +2190,39 @@ def main():
                     song_selected = search_result['song_selected']
 
             # Reset idle timer after exiting search window
-            last_keypress_time = time.time()
+            last_keypress_time = time.monotonic()
 
             # Close rotating record popup if it's showing
-            if rotating_record_rotation_stop_flag is not None:
-                try:
-                    rotating_record_rotation_stop_flag.set()
-                    # Wait for pygame thread to finish closing
-                    time.sleep(0.2)  # Give popup thread time to clean up
-                    rotating_record_rotation_stop_flag = None
-                    rotating_record_start_time = None
-                except Exception as e:
-                    pass
+            close_rotating_record_popup(restore_windows=False)
 
         #  keyboard entry PySimpleGUI
-        if event == "--A--" or (event) == "a":
-            # Reset idle timer when category key is pressed (for rotating record popup)
-            last_keypress_time = time.time()
-            selection_entry_letter = "A"
-            disable_b_selection_buttons()
-            disable_c_selection_buttons()
-            enable_numbered_selection_buttons()
-        if event == "--B--" or (event) == "b":
-            # Reset idle timer when category key is pressed (for rotating record popup)
-            last_keypress_time = time.time()
-            selection_entry_letter = "B"
-            disable_a_selection_buttons()
-            disable_c_selection_buttons()
-            enable_numbered_selection_buttons()
-        if event == "--C--" or (event) == "c":
-            # Reset idle timer when category key is pressed (for rotating record popup)
-            last_keypress_time = time.time()
-            selection_entry_letter = "C"
-            disable_a_selection_buttons()
-            disable_b_selection_buttons()
+        selected_letter = LETTER_EVENT_MAP.get(event)
+        if selected_letter is not None:
+            selection_entry_letter = selected_letter
+            for disable_other_letter_buttons in other_letter_disablers[selected_letter]:
+                disable_other_letter_buttons()
             enable_numbered_selection_buttons()
         #if event == "--X--" or (event) == "x":
         if (event) == "x":
-            # Reset idle timer when credit key is pressed (for rotating record popup)
-            last_keypress_time = time.time()
             credit_amount += 1
-            info_screen_window['--credits--'].Update('CREDITS ' + str(credit_amount))
-            # Add credit to log file
-            now = datetime.now()
-            current_time = now.strftime("%H:%M:%S")
-            with open('log.txt', 'a') as log:
-                log.write('\n' + str(current_time) + ' Quarter Added,')    
-        if event == "--1--" or (event) == "1":
-            # Reset idle timer when number key is pressed (for rotating record popup)
-            last_keypress_time = time.time()
-            selection_entry_number = "1"
+            credits_text.Update('CREDITS ' + str(credit_amount))
+            # Add credit to log file - appended by the file I/O worker through the same open
+            # handle it uses for the engine's song-play lines (keyed by the engine's log path)
+            current_time = time.strftime("%H:%M:%S")
+            file_io_queue.put({
+                'operation': 'append_log',
+                'path': jukebox.log_file,
+                'line': '\n' + str(current_time) + ' Quarter Added,'
+            })
+        selected_number = NUMBER_EVENT_MAP.get(event)
+        if selected_number is not None:
+            selection_entry_number = selected_number
             disable_numbered_selection_buttons()
             disable_a_selection_buttons()
             disable_b_selection_buttons()
             disable_c_selection_buttons()
-            jukebox_selection_window['--A1--'].update(disabled=False)
-            jukebox_selection_window['--button0_top--'].update(disabled=False)
-            jukebox_selection_window['--button0_bottom--'].update(disabled=False)
-            jukebox_selection_window['--B1--'].update(disabled=False)
-            jukebox_selection_window['--button7_top--'].update(disabled=False)
-            jukebox_selection_window['--button7_bottom--'].update(disabled=False)
-            jukebox_selection_window['--C1--'].update(disabled=False)
-            jukebox_selection_window['--button14_top--'].update(disabled=False)
-            jukebox_selection_window['--button14_bottom--'].update(disabled=False)
-            control_button_window['--A--'].update(disabled=False)
-            control_button_window['--B--'].update(disabled=False)
-            control_button_window['--C--'].update(disabled=False)
-            if selection_entry_letter:
-                selection_entry_complete(selection_entry_letter, selection_entry_number)
-        if event == "--2--" or (event) == "2":
-            # Reset idle timer when number key is pressed (for rotating record popup)
-            last_keypress_time = time.time()
-            selection_entry_number = "2"
-            disable_numbered_selection_buttons()
-            disable_a_selection_buttons()
-            disable_b_selection_buttons()
-            disable_c_selection_buttons()
-            jukebox_selection_window['--A2--'].update(disabled=False)
-            jukebox_selection_window['--button1_top--'].update(disabled=False)
-            jukebox_selection_window['--button1_bottom--'].update(disabled=False)
-            jukebox_selection_window['--B2--'].update(disabled=False)
-            jukebox_selection_window['--button8_top--'].update(disabled=False)
-            jukebox_selection_window['--button8_bottom--'].update(disabled=False)
-            jukebox_selection_window['--C2--'].update(disabled=False)
-            jukebox_selection_window['--button15_top--'].update(disabled=False)
-            jukebox_selection_window['--button15_bottom--'].update(disabled=False)
-            control_button_window['--A--'].update(disabled=False)
-            control_button_window['--B--'].update(disabled=False)
-            control_button_window['--C--'].update(disabled=False)
-            if selection_entry_letter:
-                selection_entry_complete(selection_entry_letter, selection_entry_number)
-        if event == "--3--" or (event) == "3":
-            # Reset idle timer when number key is pressed (for rotating record popup)
-            last_keypress_time = time.time()
-            selection_entry_number = "3"
-            disable_numbered_selection_buttons()
-            disable_a_selection_buttons()
-            disable_b_selection_buttons()
-            disable_c_selection_buttons()
-            jukebox_selection_window['--A3--'].update(disabled=False)
-            jukebox_selection_window['--button2_top--'].update(disabled=False)
-            jukebox_selection_window['--button2_bottom--'].update(disabled=False)
-            jukebox_selection_window['--B3--'].update(disabled=False)
-            jukebox_selection_window['--button9_top--'].update(disabled=False)
-            jukebox_selection_window['--button9_bottom--'].update(disabled=False)
-            jukebox_selection_window['--C3--'].update(disabled=False)
-            jukebox_selection_window['--button16_top--'].update(disabled=False)
-            jukebox_selection_window['--button16_bottom--'].update(disabled=False)
-            control_button_window['--A--'].update(disabled=False)
-            control_button_window['--B--'].update(disabled=False)
-            control_button_window['--C--'].update(disabled=False)
-            if selection_entry_letter:
-                selection_entry_complete(selection_entry_letter, selection_entry_number)
-        if event == "--4--" or (event) == "4":
-            # Reset idle timer when number key is pressed (for rotating record popup)
-            last_keypress_time = time.time()
-            selection_entry_number = "4"
-            disable_numbered_selection_buttons()
-            disable_a_selection_buttons()
-            disable_b_selection_buttons()
-            disable_c_selection_buttons()
-            jukebox_selection_window['--A4--'].update(disabled=False)
-            jukebox_selection_window['--button3_top--'].update(disabled=False)
-            jukebox_selection_window['--button3_bottom--'].update(disabled=False)
-            jukebox_selection_window['--B4--'].update(disabled=False)
-            jukebox_selection_window['--button10_top--'].update(disabled=False)
-            jukebox_selection_window['--button10_bottom--'].update(disabled=False)
-            jukebox_selection_window['--C4--'].update(disabled=False)
-            jukebox_selection_window['--button17_top--'].update(disabled=False)
-            jukebox_selection_window['--button17_bottom--'].update(disabled=False)
-            control_button_window['--A--'].update(disabled=False)
-            control_button_window['--B--'].update(disabled=False)
-            control_button_window['--C--'].update(disabled=False)
-            if selection_entry_letter:
-                selection_entry_complete(selection_entry_letter, selection_entry_number)
-        if event == "--5--" or (event) == "5":
-            # Reset idle timer when number key is pressed (for rotating record popup)
-            last_keypress_time = time.time()
-            selection_entry_number = "5"
-            disable_numbered_selection_buttons()
-            disable_a_selection_buttons()
-            disable_b_selection_buttons()
-            disable_c_selection_buttons()
-            jukebox_selection_window['--A5--'].update(disabled=False)
-            jukebox_selection_window['--button4_top--'].update(disabled=False)
-            jukebox_selection_window['--button4_bottom--'].update(disabled=False)
-            jukebox_selection_window['--B5--'].update(disabled=False)
-            jukebox_selection_window['--button11_top--'].update(disabled=False)
-            jukebox_selection_window['--button11_bottom--'].update(disabled=False)
-            jukebox_selection_window['--C5--'].update(disabled=False)
-            jukebox_selection_window['--button18_top--'].update(disabled=False)
-            jukebox_selection_window['--button18_bottom--'].update(disabled=False)
-            control_button_window['--A--'].update(disabled=False)
-            control_button_window['--B--'].update(disabled=False)
-            control_button_window['--C--'].update(disabled=False)
-            if selection_entry_letter:
-                selection_entry_complete(selection_entry_letter, selection_entry_number)
-        if event == "--6--" or (event) == "6":
-            # Reset idle timer when number key is pressed (for rotating record popup)
-            last_keypress_time = time.time()
-            selection_entry_number = "6"
-            disable_numbered_selection_buttons()
-            disable_a_selection_buttons()
-            disable_b_selection_buttons()
-            disable_c_selection_buttons()
-            jukebox_selection_window['--A6--'].update(disabled=False)
-            jukebox_selection_window['--button5_top--'].update(disabled=False)
-            jukebox_selection_window['--button5_bottom--'].update(disabled=False)
-            jukebox_selection_window['--B6--'].update(disabled=False)
-            jukebox_selection_window['--button12_top--'].update(disabled=False)
-            jukebox_selection_window['--button12_bottom--'].update(disabled=False)
-            jukebox_selection_window['--C6--'].update(disabled=False)
-            jukebox_selection_window['--button19_top--'].update(disabled=False)
-            jukebox_selection_window['--button19_bottom--'].update(disabled=False)
-            control_button_window['--A--'].update(disabled=False)
-            control_button_window['--B--'].update(disabled=False)
-            control_button_window['--C--'].update(disabled=False)
-            if selection_entry_letter:
-                selection_entry_complete(selection_entry_letter, selection_entry_number)
-        if event == "--7--" or (event) == "7":
-            # Reset idle timer when number key is pressed (for rotating record popup)
-            last_keypress_time = time.time()
-            selection_entry_number = "7"
-            disable_numbered_selection_buttons()
-            disable_a_selection_buttons()
-            disable_b_selection_buttons()
-            disable_c_selection_buttons()
-            jukebox_selection_window['--A7--'].update(disabled=False)
-            jukebox_selection_window['--button6_top--'].update(disabled=False)
-            jukebox_selection_window['--button6_bottom--'].update(disabled=False)
-            jukebox_selection_window['--B7--'].update(disabled=False)
-            jukebox_selection_window['--button13_top--'].update(disabled=False)
-            jukebox_selection_window['--button13_bottom--'].update(disabled=False)
-            jukebox_selection_window['--C7--'].update(disabled=False)
-            jukebox_selection_window['--button20_top--'].update(disabled=False)
-            jukebox_selection_window['--button20_bottom--'].update(disabled=False)
-            control_button_window['--A--'].update(disabled=False)
-            control_button_window['--B--'].update(disabled=False)
-            control_button_window['--C--'].update(disabled=False)
+            for element in number_row_elements[selected_number]:
+                set_disabled(element, False)
             if selection_entry_letter:
                 selection_entry_complete(selection_entry_letter, selection_entry_number)
         if event == "--correct--" or (event) == "C":
@@ -1975,19 +2230,15 @@ def main():
             selection_entry_letter = ""  # Used for selection entry
             selection_entry_number = ""  # Used for selection entry
             selection_entry = ""  # Used for selection entry
-            control_button_window['--select--'].update(disabled=True)
+            select_button.update(disabled=True)
         if event == "--select--" or (event) == 'S':
-            # Reset idle timer when select key is pressed (for rotating record popup)
-            last_keypress_time = time.time()
-            print("Entering Song Selected")
+            console_log("Entering Song Selected")
             if credit_amount == 0:
-                #VLC Song Playback Code Begin
-                p = create_vlc_player_silent('jukebox_required_audio_files/buzz.mp3')
-                p.play()
+                play_buzz()
                 enable_all_buttons()
                 selection_entry_letter = ""  # Used for selection entry
                 selection_entry_number = ""  # Used for selection entry
-                control_button_window['--select--'].update(disabled=True)
+                select_button.update(disabled=True)
             else:                
                 try:
                     if song_selected == "":
@@ -1997,71 +2248,14 @@ def main():
                 # Clear variables no longer needed
                 selection_entry_letter = ""
                 selection_entry_number = ""
-                if song_selected == "A1":
-                    paid_song_selected_title = (jukebox_selection_window['--button0_top--'].get_text())
-                    paid_song_selected_artist = (jukebox_selection_window['--button0_bottom--'].get_text())
-                if song_selected == "A2":
-                    paid_song_selected_title = (jukebox_selection_window['--button1_top--'].get_text())
-                    paid_song_selected_artist = (jukebox_selection_window['--button1_bottom--'].get_text())
-                if song_selected == "A3":
-                    paid_song_selected_title = (jukebox_selection_window['--button2_top--'].get_text())
-                    paid_song_selected_artist = (jukebox_selection_window['--button2_bottom--'].get_text())
-                if song_selected == "A4":
-                    paid_song_selected_title = (jukebox_selection_window['--button3_top--'].get_text())
-                    paid_song_selected_artist = (jukebox_selection_window['--button3_bottom--'].get_text())
-                if song_selected == "A5":
-                    paid_song_selected_title = (jukebox_selection_window['--button4_top--'].get_text())
-                    paid_song_selected_artist = (jukebox_selection_window['--button4_bottom--'].get_text())
-                if song_selected == "A6":
-                    paid_song_selected_title = (jukebox_selection_window['--button5_top--'].get_text())
-                    paid_song_selected_artist = (jukebox_selection_window['--button5_bottom--'].get_text())
-                if song_selected == "A7":
-                    paid_song_selected_title = (jukebox_selection_window['--button6_top--'].get_text())
-                    paid_song_selected_artist = (jukebox_selection_window['--button6_bottom--'].get_text())
-                if song_selected == "B1":
-                    paid_song_selected_title = (jukebox_selection_window['--button7_top--'].get_text())
-                    paid_song_selected_artist = (jukebox_selection_window['--button7_bottom--'].get_text())
-                if song_selected == "B2":
-                    paid_song_selected_title = (jukebox_selection_window['--button8_top--'].get_text())
-                    paid_song_selected_artist = (jukebox_selection_window['--button8_bottom--'].get_text())
-                if song_selected == "B3":
-                    paid_song_selected_title = (jukebox_selection_window['--button9_top--'].get_text())
-                    paid_song_selected_artist = (jukebox_selection_window['--button9_bottom--'].get_text())
-                if song_selected == "B4":
-                    paid_song_selected_title = (jukebox_selection_window['--button10_top--'].get_text())
-                    paid_song_selected_artist = (jukebox_selection_window['--button10_bottom--'].get_text())
-                if song_selected == "B5":
-                    paid_song_selected_title = (jukebox_selection_window['--button11_top--'].get_text())
-                    paid_song_selected_artist = (jukebox_selection_window['--button11_bottom--'].get_text())
-                if song_selected == "B6":
-                    paid_song_selected_title = (jukebox_selection_window['--button12_top--'].get_text())
-                    paid_song_selected_artist = (jukebox_selection_window['--button12_bottom--'].get_text())
-                if song_selected == "B7":
-                    paid_song_selected_title = (jukebox_selection_window['--button13_top--'].get_text())
-                    paid_song_selected_artist = (jukebox_selection_window['--button13_bottom--'].get_text())
-                if song_selected == "C1":
-                    paid_song_selected_title = (jukebox_selection_window['--button14_top--'].get_text())
-                    paid_song_selected_artist = (jukebox_selection_window['--button14_bottom--'].get_text())
-                if song_selected == "C2":
-                    paid_song_selected_title = (jukebox_selection_window['--button15_top--'].get_text())
-                    paid_song_selected_artist = (jukebox_selection_window['--button15_bottom--'].get_text())
-                if song_selected == "C3":
-                    paid_song_selected_title = (jukebox_selection_window['--button16_top--'].get_text())
-                    paid_song_selected_artist = (jukebox_selection_window['--button16_bottom--'].get_text())
-                if song_selected == "C4":
-                    paid_song_selected_title = (jukebox_selection_window['--button17_top--'].get_text())
-                    paid_song_selected_artist = (jukebox_selection_window['--button17_bottom--'].get_text())
-                if song_selected == "C5":
-                    paid_song_selected_title = (jukebox_selection_window['--button18_top--'].get_text())
-                    paid_song_selected_artist = (jukebox_selection_window['--button18_bottom--'].get_text())
-                if song_selected == "C6":
-                    paid_song_selected_title = (jukebox_selection_window['--button19_top--'].get_text())
-                    paid_song_selected_artist = (jukebox_selection_window['--button19_bottom--'].get_text())
-                if song_selected == "C7":
-                    paid_song_selected_title = (jukebox_selection_window['--button20_top--'].get_text())
-                    paid_song_selected_artist = (jukebox_selection_window['--button20_bottom--'].get_text())
+                # Read the chosen selection's title and artist from its cached buttons
+                selected_elements = selection_entry_elements.get(song_selected)
+                if selected_elements is not None:
+                    _, selected_title_button, selected_artist_button = selected_elements
+                    paid_song_selected_title = selected_title_button.get_text()
+                    paid_song_selected_artist = selected_artist_button.get_text()
                 song_selected = ""
-                control_button_window['--select--'].update(disabled=True)
+                select_button.update(disabled=True)
                 disable_numbered_selection_buttons()
                 # Check and remove The from artist name
                 try:
@@ -2070,209 +2264,193 @@ def main():
                         paid_song_selected_artist = paid_song_selected_artist_no_the
 
                     # add selection to paid song list
-                    counter = 0
-                    song_found = False
-                    #  find library number of selected song
-                    for i in MusicMasterSongList:
-                        # search for match of song in MusicMasterSongList
-                        # Truncate both sides to 22 characters for consistent matching
-                        button_title_truncated = str(paid_song_selected_title)[:22]
-                        button_artist_truncated = str(paid_song_selected_artist)[:22]
-                        library_title_truncated = str(MusicMasterSongList[counter]['title'][:22])
-                        library_artist_truncated = str(MusicMasterSongList[counter]['artist'][:22])
-
-                        if button_title_truncated == library_title_truncated and button_artist_truncated == library_artist_truncated:
-                            song_found = True
+                    #  find library number of selected song - both sides truncated to 22 characters for consistent matching
+                    counter = song_title_artist_index.get((str(paid_song_selected_title)[:22], str(paid_song_selected_artist)[:22]))
+                    song_found = counter is not None
+                    if song_found:
+                        #  add matched song number to variable
+                        song_to_add = int(MusicMasterSongList[counter]['number'])
+                        #  open PaidMusicPlaylist text file and append song number to list
+                        paid_music_file_path = os.path.join(dir_path, 'PaidMusicPlayList.txt')
+
+                        # Initialize PaidMusicPlayList with existing data or empty list
+                        PaidMusicPlayList = read_paid_playlist(paid_music_file_path)
+
+                        # Only the song being added can be a duplicate - refuse it if it is already waiting to play
+                        if song_to_add in PaidMusicPlayList:
+                            console_log('Duplicate Song Found')
+                            play_buzz()
+                            enable_all_buttons()
+                            selection_entry_letter = ""  # Used for selection entry
+                            selection_entry_number = ""  # Used for selection entry
+                            selection_entry = ""  # Used for selection entry
+                            select_button.update(disabled=True)
+                            enable_all_buttons()
+                        else:
                             # add song to upcoming list file
                             # UpcomingSongPlayList
                             UpcomingSongPlayList.append(str(MusicMasterSongList[counter]['title'][:22]) + ' - ' + str(MusicMasterSongList[counter]['artist'][:22]))
-                            #  add matched song number to variable
-                            song_to_add = (MusicMasterSongList[counter]['number'])
-                            #  open PaidMusicPlaylist text file and append song number to list
-                            paid_music_file_path = os.path.join(dir_path, 'PaidMusicPlayList.txt')
-
-                            # Initialize PaidMusicPlayList with existing data or empty list
-                            PaidMusicPlayList = read_paid_playlist(paid_music_file_path)
-
-                            PaidMusicPlayList.append(int(song_to_add))
-
-                            # Check for duplicate song numbers in PaidMusicPlayList
-                            # Remove duplicate song numbers from PaidMusicPlayList
-                            test_set = set(PaidMusicPlayList)
-                            if len(PaidMusicPlayList) != len(test_set):
-                                PaidMusicPlayList = list(set(PaidMusicPlayList)) # https://bit.ly/4cZ7A6R
-                                UpcomingSongPlayList.pop(-1)
-                                print('Duplicate Song Found')
-                                #VLC Song Playback Code Begin
-                                p = create_vlc_player_silent('jukebox_required_audio_files/buzz.mp3')
-                                p.play()
-                                enable_all_buttons()
-                                selection_entry_letter = ""  # Used for selection entry
-                                selection_entry_number = ""  # Used for selection entry
-                                selection_entry = ""  # Used for selection entry
-                                control_button_window['--select--'].update(disabled=True)
-                                enable_all_buttons()
-                                break
-
+                            PaidMusicPlayList.append(song_to_add)
                             # Write PaidMusicPlayList directly to file immediately with file locking
                             write_paid_playlist(paid_music_file_path, PaidMusicPlayList)
                             #  end search
                             enable_all_buttons()
                             credit_amount -= 1
-                            info_screen_window['--credits--'].Update('CREDITS ' + str(credit_amount))
+                            credits_text.Update('CREDITS ' + str(credit_amount))
                             # Call 45rpm popup display function
+                            from popup_45rpm_song_selection_code_module import display_45rpm_popup
                             active_popup_window, popup_start_time, popup_duration = display_45rpm_popup(MusicMasterSongList, counter, jukebox_selection_window)
+                            if popup_duration is not None:
+                                # Wake the event loop when the popup is due to close
+                                jukebox_selection_window.TKroot.after(
+                                    int(popup_duration * 1000) + 1,
+                                    lambda: song_playing_lookup_window.write_event_value('--POPUP_TIMEOUT--', None))
                             # Update the upcoming selections display to show newly added paid song
                             update_upcoming_selections(info_screen_window, UpcomingSongPlayList)
-                            break
-                        counter += 1
 
                     if not song_found:
-                        print(f"ERROR: Song '{paid_song_selected_title}' by '{paid_song_selected_artist}' not found in music library!")
+                        console_log(f"ERROR: Song '{paid_song_selected_title}' by '{paid_song_selected_artist}' not found in music library!")
                         enable_all_buttons()
-                        control_button_window['--select--'].update(disabled=True)
+                        select_button.update(disabled=True)
 
                 except Exception as e:
-                    print(f"ERROR during song selection: {str(e)}")
+                    console_log(f"ERROR during song selection: {str(e)}")
                     import traceback
                     traceback.print_exc()
                     enable_all_buttons()
-                    control_button_window['--select--'].update(disabled=True)
+                    select_button.update(disabled=True)
         if event is None or event == 'Cancel' or event == 'Exit':
-            print(f'closing window = {window.Title}')
+            console_log(f'closing window = {window.Title}')
             break
         if event == '--SONG_PLAYING_LOOKUP--':
             global last_song_check, song_start_time, last_displayed_time
-            with open('CurrentSongPlaying.txt', 'r') as CurrentSongPlayingOpen:
-                song_currently_playing = CurrentSongPlayingOpen.read()
-                #  search MusicMasterSonglist for location string
-                counter=0
-                for x in MusicMasterSongList:
-                    if MusicMasterSongList[counter]['location'] == song_currently_playing:
-                        # Update Jukebox Info Screen
-                        song_title = MusicMasterSongList[counter]['title']
-                        display_title = song_title[:22]  # Limit to first 22 characters
-                        info_screen_window['--song_title--'].Update(display_title)
-                        info_screen_window['--song_artist--'].Update(
-                            MusicMasterSongList[counter]['artist'][:29])
-                        info_screen_window['--mini_song_title--'].Update(
-                            '  Title: ' + MusicMasterSongList[counter]['title'])
-                        info_screen_window['--mini_song_artist--'].Update(
-                            '  Artist: ' + MusicMasterSongList[counter]['artist'])
-
-                        # UPDATE COUNTDOWN from VLC
-                        try:
-                            current_time_ms = jukebox.vlc_media_player.get_time()
-                            media = jukebox.vlc_media_player.get_media()
-                            duration_ms = media.get_duration() if media else -1
-
-                            if current_time_ms > 0 and duration_ms > 0:
-                                elapsed_seconds = current_time_ms / 1000.0
-                                total_seconds = duration_ms / 1000.0
-                                time_remaining_seconds = total_seconds - elapsed_seconds
-                                formatted_time = format_time_remaining(time_remaining_seconds)
-                                display_string = '  Year: ' + MusicMasterSongList[counter]['year'] + '   Remaining: ' + formatted_time
-                            else:
-                                display_string = '  Year: ' + MusicMasterSongList[counter]['year'] + '   Remaining: ' + MusicMasterSongList[counter]['duration']
-
-                            # Only update if changed
-                            if display_string != last_displayed_time:
-                                info_screen_window['--year--'].Update(display_string)
-                                last_displayed_time = display_string
-                        except:
-                            info_screen_window['--year--'].Update(
-                                '  Year: ' + MusicMasterSongList[counter]['year'] + '   Remaining: ' +
-                                MusicMasterSongList[counter]['duration'])
-
-                        info_screen_window['--album--'].Update(
-                            '  Album: ' + MusicMasterSongList[counter]['album'])
-                        #  Check to see if curent song playing has changed
-                        with open('CurrentSongPlaying.txt', 'r') as CurrentSongPlayingOpen:
-                            song_currently_playing = CurrentSongPlayingOpen.read()
-                            # Set up first check
-                            if last_song_check == "":
-                                last_song_check = song_currently_playing
-                            #  Check to see if current song has changed
-                            if last_song_check != song_currently_playing:
-                                last_song_check = song_currently_playing
-                                # Clear the shared label cache when song changes to prevent memory buildup
-                                clear_song_label_cache()
-                                # FIX: Only remove from UpcomingSongPlayList if the currently playing song matches the first upcoming song
-                                # This prevents paid songs from being removed when a random song plays instead
-                                if UpcomingSongPlayList:  # Only if there are upcoming songs
-                                    # Build the current song string in the same format as UpcomingSongPlayList entries
-                                    current_song_str = str(MusicMasterSongList[counter]['title'][:22]) + ' - ' + str(MusicMasterSongList[counter]['artist'][:22])
-                                    upcoming_song_str = UpcomingSongPlayList[0]
-
-                                    # Only remove from upcoming list if the currently playing song matches the first upcoming song
-                                    if current_song_str == upcoming_song_str:
-                                        try:
-                                            UpcomingSongPlayList.pop(0)
-                                        except IndexError: # Executed if no first entry in list
-                                            pass
-                                        # Update the display after removing the song
-                                        update_upcoming_selections(info_screen_window, UpcomingSongPlayList)
-                                # Always update the now-playing popup
-                                # active_popup_window, popup_start_time, popup_duration = display_45rpm_now_playing_popup(MusicMasterSongList, counter, jukebox_selection_window, upcoming_selections_update)
-                                # Reset song start time when song changes
-                                song_start_time = time.time()
-
-                        # ROTATING RECORD POPUP LOGIC
-                        # Get current playback time and duration from VLC
-                        try:
-                            current_time_ms = jukebox.vlc_media_player.get_time()
-                            media = jukebox.vlc_media_player.get_media()
-                            duration_ms = media.get_duration() if media else -1
-
-                            if current_time_ms > 0 and duration_ms > 0:
-                                # Convert to seconds
-                                elapsed_seconds = current_time_ms / 1000.0
-                                total_seconds = duration_ms / 1000.0
-                                time_remaining_seconds = total_seconds - elapsed_seconds
-                                time_since_keypress = time.time() - last_keypress_time
-
-                                # Conditions to SHOW rotating record popup
-                                should_show = (
-                                    elapsed_seconds >= 20 and  # Song playing >= 20 seconds
-                                    time_since_keypress >= 20 and  # Idle >= 20 seconds
-                                    time_remaining_seconds >= 5 and  # Song has >= 5 seconds remaining
-                                    rotating_record_rotation_stop_flag is None  # Popup not already shown
-                                )
-
-                                # Conditions to CLOSE rotating record popup
-                                should_close = (
-                                    rotating_record_rotation_stop_flag is not None and
-                                    (time_remaining_seconds < 5)  # Close when 5 seconds remaining
-                                )
-
-                                # Show popup if conditions met
-                                if should_show:
-                                    # Hide selector windows (keep background, info_screen, and arrow windows visible)
-                                    jukebox_selection_window.Hide()
-                                    control_button_window.Hide()
-                                    song_playing_lookup_window.Hide()
-                                    rotating_record_rotation_stop_flag, rotating_record_start_time = display_rotating_record_popup(MusicMasterSongList, counter, total_seconds, elapsed_seconds)
-
-                                # Close popup if song ending
-                                if should_close:
-                                    rotating_record_rotation_stop_flag.set()
-                                    log_popup_event("popup window rotating closed")
-                                    # Wait for pygame thread to finish closing
-                                    time.sleep(0.2)  # Give popup thread time to clean up
-                                    rotating_record_rotation_stop_flag = None
-                                    rotating_record_start_time = None
-                                    # Restore selector windows (background, info_screen, and arrow windows stay visible)
-                                    jukebox_selection_window.UnHide()
-                                    control_button_window.UnHide()
-                                    song_playing_lookup_window.UnHide()
-                        except Exception as e:
-                            pass
-
-                        if UpcomingSongPlayList != []:
-                            # update upcoming selections on jukebox screens
+            # Only re-read CurrentSongPlaying.txt when the engine has rewritten it - the size is checked too
+            # because a rewrite's truncate and write can land within one mtime tick
+            current_song_stat = os.stat('CurrentSongPlaying.txt')
+            current_song_version = (current_song_stat.st_mtime_ns, current_song_stat.st_size)
+            if current_song_version != last_current_song_version:
+                with open('CurrentSongPlaying.txt', 'r') as CurrentSongPlayingOpen:
+                    song_currently_playing = CurrentSongPlayingOpen.read()
+                last_current_song_version = current_song_version
+            #  look up the MusicMasterSonglist number for the location string
+            counter = song_location_index.get(song_currently_playing)
+            if counter is not None:
+                # Update Jukebox Info Screen - title, artist and album only change with the song
+                if counter != info_screen_song_number:
+                    song_title = MusicMasterSongList[counter]['title']
+                    display_title = song_title[:22]  # Limit to first 22 characters
+                    info_screen_window['--song_title--'].Update(display_title)
+                    info_screen_window['--song_artist--'].Update(
+                        MusicMasterSongList[counter]['artist'][:29])
+                    info_screen_window['--mini_song_title--'].Update(
+                        '  Title: ' + MusicMasterSongList[counter]['title'])
+                    info_screen_window['--mini_song_artist--'].Update(
+                        '  Artist: ' + MusicMasterSongList[counter]['artist'])
+                    info_screen_window['--album--'].Update(
+                        '  Album: ' + MusicMasterSongList[counter]['album'])
+                    info_screen_song_number = counter
+
+                # UPDATE COUNTDOWN from VLC
+                try:
+                    current_time_ms = jukebox.vlc_media_player.get_time()
+                    media = jukebox.vlc_media_player.get_media()
+                    duration_ms = media.get_duration() if media else -1
+
+                    if current_time_ms > 0 and duration_ms > 0:
+                        elapsed_seconds = current_time_ms / 1000.0
+                        total_seconds = duration_ms / 1000.0
+                        time_remaining_seconds = total_seconds - elapsed_seconds
+                        formatted_time = format_time_remaining(time_remaining_seconds)
+                        display_string = '  Year: ' + MusicMasterSongList[counter]['year'] + '   Remaining: ' + formatted_time
+                    else:
+                        display_string = '  Year: ' + MusicMasterSongList[counter]['year'] + '   Remaining: ' + MusicMasterSongList[counter]['duration']
+
+                    # Only update if changed
+                    if display_string != last_displayed_time:
+                        info_screen_window['--year--'].Update(display_string)
+                        last_displayed_time = display_string
+                except:
+                    info_screen_window['--year--'].Update(
+                        '  Year: ' + MusicMasterSongList[counter]['year'] + '   Remaining: ' +
+                        MusicMasterSongList[counter]['duration'])
+
+                #  Check to see if curent song playing has changed
+                # Set up first check
+                if last_song_check == "":
+                    last_song_check = song_currently_playing
+                #  Check to see if current song has changed
+                if last_song_check != song_currently_playing:
+                    last_song_check = song_currently_playing
+                    # Clear the shared label cache when song changes to prevent memory buildup
+                    clear_song_label_cache()
+                    # FIX: Only remove from UpcomingSongPlayList if the currently playing song matches the first upcoming song
+                    # This prevents paid songs from being removed when a random song plays instead
+                    if UpcomingSongPlayList:  # Only if there are upcoming songs
+                        # Build the current song string in the same format as UpcomingSongPlayList entries
+                        current_song_str = str(MusicMasterSongList[counter]['title'][:22]) + ' - ' + str(MusicMasterSongList[counter]['artist'][:22])
+                        upcoming_song_str = UpcomingSongPlayList[0]
+
+                        # Only remove from upcoming list if the currently playing song matches the first upcoming song
+                        if current_song_str == upcoming_song_str:
+                            try:
+                                UpcomingSongPlayList.pop(0)
+                            except IndexError: # Executed if no first entry in list
+                                pass
+                            # Update the display after removing the song
                             update_upcoming_selections(info_screen_window, UpcomingSongPlayList)
-                        break
-                    counter +=1
+                    # Always update the now-playing popup
+                    # active_popup_window, popup_start_time, popup_duration = display_45rpm_now_playing_popup(MusicMasterSongList, counter, jukebox_selection_window, upcoming_selections_update)
+                    # Reset song start time when song changes
+                    song_start_time = now
+
+                # ROTATING RECORD POPUP LOGIC
+                # Get current playback time and duration from VLC
+                try:
+                    current_time_ms = jukebox.vlc_media_player.get_time()
+                    media = jukebox.vlc_media_player.get_media()
+                    duration_ms = media.get_duration() if media else -1
+
+                    if current_time_ms > 0 and duration_ms > 0:
+                        # Convert to seconds
+                        elapsed_seconds = current_time_ms / 1000.0
+                        total_seconds = duration_ms / 1000.0
+                        time_remaining_seconds = total_seconds - elapsed_seconds
+                        time_since_keypress = now - last_keypress_time
+
+                        # Conditions to SHOW rotating record popup
+                        should_show = (
+                            elapsed_seconds >= 20 and  # Song playing >= 20 seconds
+                            time_since_keypress >= 20 and  # Idle >= 20 seconds
+                            time_remaining_seconds >= 5 and  # Song has >= 5 seconds remaining
+                            rotating_record_rotation_stop_flag is None  # Popup not already shown
+                        )
+
+                        # Conditions to CLOSE rotating record popup
+                        should_close = (
+                            rotating_record_rotation_stop_flag is not None and
+                            (time_remaining_seconds < 5)  # Close when 5 seconds remaining
+                        )
+
+                        # Show popup if conditions met
+                        if should_show:
+                            # Hide selector windows (keep background, info_screen, and arrow windows visible)
+                            hide_windows(selector_windows)
+                            from popup_rotating_record_code_module import display_rotating_record_popup
+                            rotating_record_done = threading.Event()
+                            rotating_record_rotation_stop_flag, rotating_record_start_time = display_rotating_record_popup(
+                                MusicMasterSongList, counter, total_seconds, elapsed_seconds,
+                                on_close=lambda: song_playing_lookup_window.write_event_value('--ROTATING_RECORD_CLOSED--', None),
+                                rotation_done=rotating_record_done)
+
+                        # Close popup if song ending
+                        if should_close:
+                            close_rotating_record_popup()
+                except Exception as e:
+                    pass
+
+                if UpcomingSongPlayList != []:
+                    # update upcoming selections on jukebox screens
+                    update_upcoming_selections(info_screen_window, UpcomingSongPlayList)
     right_arrow_selection_window.close()
     left_arrow_selection_window.close()
     info_screen_window.close()
@@ -2320,6 +2498,11 @@ if __name__ == '__main__':
         print("[2/5] Loading master song list...")
         _load_master_song_list()
 
+        # Move everything loaded so far (modules, label mappings, song lists) into the
+        # permanent generation so later collections don't keep rescanning it
+        gc.collect()
+        gc.freeze()
+
         # Step 3: Launch engine in daemon thread for background playback
         print("[3/3] Launching engine thread and GUI...\n")
         engine_thread = threading.Thread(
@@ -2338,6 +2521,7 @@ if __name__ == '__main__':
 
         # Step 5: Cleanup when GUI closes
         print(f"\n{Colors.CYAN}Jukebox GUI closed. Shutting down...{Colors.ENDC}")
+        jukebox.close()
         sys.exit(0)
 
     except KeyboardInterrupt:
@@ -11,6 +11,8 @@ import ast
 
 # Module-level dictionary to store artist -> label mappings
 _artist_label_mapping = {}
+# Same mappings keyed by lowercased artist name, for case-insensitive lookups
+_artist_label_mapping_lower = {}
 
 
 def load_artist_label_mapping(file_path="RecordLabelAssignList.txt"):
@@ -26,7 +28,7 @@ def load_artist_label_mapping(file_path="RecordLabelAssignList.txt"):
     Returns:
         dict: Dictionary mapping artist names to label filenames
     """
-    global _artist_label_mapping
+    global _artist_label_mapping, _artist_label_mapping_lower
 
     if not os.path.exists(file_path):
         print(f"[ARTIST MAPPING] File not found: {file_path} - using random labels for all artists")
@@ -41,6 +43,10 @@ def load_artist_label_mapping(file_path="RecordLabelAssignList.txt"):
 
         # Convert list of lists to dictionary
         _artist_label_mapping = {artist: label for artist, label in artist_list}
+        # First mapping wins when two artists differ only by case
+        _artist_label_mapping_lower = {}
+        for artist, label in _artist_label_mapping.items():
+            _artist_label_mapping_lower.setdefault(artist.lower(), label)
 
         print(f"[ARTIST MAPPING] Loaded {len(_artist_label_mapping)} artist-to-label mappings")
         for artist, label in _artist_label_mapping.items():
@@ -65,15 +71,10 @@ def get_artist_label(artist_name):
         str: Label filename if artist is mapped, None otherwise
     """
     # Case-insensitive lookup
-    artist_lower = artist_name.lower()
-
-    for mapped_artist, label in _artist_label_mapping.items():
-        if mapped_artist.lower() == artist_lower:
-            print(f"[ARTIST MAPPING] Found mapping: '{artist_name}' -> {label}")
-            return label
-
-    # No mapping found
-    return None
+    label = _artist_label_mapping_lower.get(artist_name.lower())
+    if label is not None:
+        print(f"[ARTIST MAPPING] Found mapping: '{artist_name}' -> {label}")
+    return label
 
 
 def get_mapping_count():
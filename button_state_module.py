@@ -0,0 +1,23 @@
+"""
+Button State Module
+Skips PySimpleGUI button updates that would not change the button's disabled state
+"""
+
+
+def set_disabled(element, disabled):
+    """
+    Set an element's disabled state, skipping the update when it is already in that state.
+
+    Every .update(disabled=...) call reconfigures the underlying tkinter widget, even when
+    nothing changes. PySimpleGUI elements record their current state in Element.Disabled,
+    so that is checked first and the widget is only touched on a real change.
+
+    Args:
+        element: A PySimpleGUI element (e.g. sg.Button)
+        disabled (bool): True to disable the element, False to enable it
+
+    Returns:
+        None
+    """
+    if element.Disabled != disabled:
+        element.update(disabled=disabled)
@@ -0,0 +1,78 @@
+"""
+Console Log Module
+Writes GUI console messages from a background thread so the event loop never waits on stdout
+"""
+
+import atexit
+import queue
+import sys
+import threading
+
+_log_queue = queue.Queue()
+
+
+def _write_console(message):
+    """
+    Write one message to stdout, doing nothing when there is no console.
+
+    stdout is None under pythonw or a detached launch, and a closed pipe raises on write;
+    neither may stop the worker thread, so both are ignored like print() would be.
+
+    Args:
+        message (str): Message to write
+
+    Returns:
+        None
+    """
+    if sys.stdout is not None:
+        try:
+            sys.stdout.write(message + '\n')
+            sys.stdout.flush()
+        except (OSError, ValueError):
+            pass
+
+
+def _console_log_worker():
+    """
+    Drain queued console messages and write them to stdout (runs in a daemon thread).
+
+    Returns:
+        None
+    """
+    while True:
+        _write_console(_log_queue.get())
+
+
+def console_log(message):
+    """
+    Queue a message for the console instead of printing it on the calling thread.
+
+    stdout is often a slow IDE console or pipe, so a print() on the GUI thread can stall
+    the event loop. Messages are written in order by a single worker thread.
+
+    Args:
+        message: Message to write; converted with str()
+
+    Returns:
+        None
+    """
+    _log_queue.put_nowait(str(message))
+
+
+def _flush_console_log():
+    """
+    Write any messages still queued when the program exits.
+
+    Returns:
+        None
+    """
+    while True:
+        try:
+            message = _log_queue.get_nowait()
+        except queue.Empty:
+            break
+        _write_console(message)
+
+
+threading.Thread(target=_console_log_worker, daemon=True).start()
+atexit.register(_flush_console_log)
@@ -1,3 +1,6 @@
+from button_state_module import set_disabled
+
+
 def disable_a_selection_buttons(jukebox_selection_window, control_button_window):
     """
     Disable all buttons for the A selection window.
@@ -24,10 +27,10 @@ def disable_a_selection_buttons(jukebox_selection_window, control_button_window)
     
     # Disable all buttons in the A selection window
     for button_key in buttons_to_disable:
-        jukebox_selection_window[button_key].update(disabled=True)
+        set_disabled(jukebox_selection_window[button_key], True)
     
     for control_button_key in control_buttons_to_disable:
-        control_button_window[control_button_key].update(disabled=True)
+        set_disabled(control_button_window[control_button_key], True)
     
     for selection_window_key in selection_windows_to_disable:
-        jukebox_selection_window[selection_window_key].update(disabled=True)
+        set_disabled(jukebox_selection_window[selection_window_key], True)
@@ -1,3 +1,6 @@
+from button_state_module import set_disabled
+
+
 def enable_all_buttons(jukebox_selection_window, control_button_window):
     """
     Enable all buttons in the jukebox selection interface.
@@ -24,10 +27,10 @@ def enable_all_buttons(jukebox_selection_window, control_button_window):
 
     # Enable all buttons in the selection window
     for button_key in buttons_to_enable:
-        jukebox_selection_window[button_key].update(disabled=False)
+        set_disabled(jukebox_selection_window[button_key], False)
 
     for control_button_key in control_buttons_to_enable:
-        control_button_window[control_button_key].update(disabled=False)
+        set_disabled(control_button_window[control_button_key], False)
 
     for selection_window_key in selection_windows_to_enable:
-        jukebox_selection_window[selection_window_key].update(disabled=False)
+        set_disabled(jukebox_selection_window[selection_window_key], False)
@@ -0,0 +1,124 @@
+"""
+MP3 Metadata Cache Module
+Caches ID3 metadata on disk so unchanged MP3 files are not re-parsed with TinyTag
+
+Each entry is keyed by the file path and stores the file's modification time and
+size alongside the extracted tags. A cached entry is only reused when both still
+match the file on disk, so edited or replaced files are always re-scanned.
+"""
+
+import json
+import os
+from typing import Any, Callable, Dict, Optional
+
+# Bump when the format of the cached tags changes so stale caches are discarded
+CACHE_VERSION = 2
+
+
+class MetadataCache:
+    """
+    Disk-backed cache of MP3 metadata keyed by (path, mtime, size).
+
+    Only the fields the jukebox needs are stored: title, artist, album, year,
+    comment and the formatted duration. Entries for files that were not seen
+    during the current scan are dropped when the cache is saved.
+    """
+
+    def __init__(self, cache_file: str, loads: Optional[Callable[[bytes], Any]] = None,
+                 dumps: Optional[Callable[[Any], bytes]] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_file (str): Path to the JSON file used to persist the cache
+            loads (callable): Parses JSON bytes (e.g. the jukebox's orjson-backed _json_loads);
+                the standard library json module is used when not given
+            dumps (callable): Serializes data to JSON bytes (e.g. _json_dumps); the standard
+                library json module is used when not given
+        """
+        self.cache_file = cache_file
+        self._loads = loads if loads is not None else json.loads
+        self._dumps = dumps if dumps is not None else (lambda obj: json.dumps(obj, separators=(',', ':')).encode('utf-8'))
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._seen: Dict[str, Dict[str, Any]] = {}
+
+    def load(self) -> bool:
+        """
+        Load cached entries from disk.
+
+        Returns:
+            bool: True if a cache file was loaded, False if missing or unreadable
+        """
+        try:
+            with open(self.cache_file, 'rb') as f:
+                data = self._loads(f.read())
+        except (IOError, ValueError):
+            self._entries = {}
+            return False
+
+        if not isinstance(data, dict) or data.get('version') != CACHE_VERSION:
+            self._entries = {}
+            return False
+
+        entries = data.get('files')
+        if not isinstance(entries, dict):
+            entries = {}
+        # Drop malformed (e.g. hand-edited) entries so they are re-scanned rather than crash get()
+        self._entries = {path: entry for path, entry in entries.items()
+                         if isinstance(entry, dict) and isinstance(entry.get('tags'), dict)}
+        return bool(self._entries)
+
+    def get(self, file_path: str, file_stat: os.stat_result) -> Optional[Dict[str, str]]:
+        """
+        Get cached tags for a file if it has not changed since it was cached.
+
+        Args:
+            file_path (str): Full path to the MP3 file
+            file_stat (os.stat_result): Current os.stat() result for the file
+
+        Returns:
+            dict: Cached tags if the mtime and size match, None otherwise
+        """
+        entry = self._entries.get(file_path)
+        if entry is None:
+            return None
+        if entry.get('mtime_ns') != file_stat.st_mtime_ns or entry.get('size') != file_stat.st_size:
+            return None
+        return entry.get('tags')
+
+    def put(self, file_path: str, file_stat: os.stat_result, tags: Dict[str, str]) -> None:
+        """
+        Record tags for a file seen during the current scan.
+
+        Args:
+            file_path (str): Full path to the MP3 file
+            file_stat (os.stat_result): os.stat() result the tags were read against
+            tags (dict): Extracted tags to cache
+        """
+        self._seen[file_path] = {
+            'mtime_ns': file_stat.st_mtime_ns,
+            'size': file_stat.st_size,
+            'tags': tags
+        }
+
+    def save(self) -> bool:
+        """
+        Save the entries recorded during the current scan to disk.
+
+        The cache is written to a temp file and renamed over the old one, so a crash
+        mid-write leaves the previous cache intact instead of an unreadable file.
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            temp_file = self.cache_file + '.tmp'
+            with open(temp_file, 'wb') as f:
+                f.write(self._dumps({'version': CACHE_VERSION, 'files': self._seen}))
+            os.replace(temp_file, self.cache_file)
+            self._entries = self._seen
+            self._seen = {}
+            return True
+        except IOError as e:
+            print(f"[METADATA CACHE] Failed to save {self.cache_file}: {e}")
+            return False
@@ -433,7 +433,7 @@ def fit_text_to_width(text, base_font_path, start_size, max_width, max_lines, dr
     return wrap_text(text, font, max_width, draw), min_font_size, font
 
 
-def rotate_record_pygame(image_path, rotation_stop_flag, window_x, window_y, window_width, window_height, no_titlebar=True, song_duration=180, elapsed_time=0):
+def rotate_record_pygame(image_path, rotation_stop_flag, window_x, window_y, window_width, window_height, no_titlebar=True, song_duration=180, elapsed_time=0, on_close=None, rotation_done=None):
     """
     Rotate a record image in real-time with authentic Wurlitzer tonearm animation.
 
@@ -453,6 +453,8 @@ def rotate_record_pygame(image_path, rotation_stop_flag, window_x, window_y, win
         window_width: Width of the pygame window
         window_height: Height of the pygame window
         no_titlebar: If True, attempts to create borderless window
+        on_close: Optional callable run (from this thread) when a keypress closes the popup
+        rotation_done: Optional threading.Event set once the pygame window has been torn down
     """
     try:
         print(f"\n=== rotate_record_pygame THREAD STARTED ===")
@@ -610,6 +612,8 @@ def rotate_record_pygame(image_path, rotation_stop_flag, window_x, window_y, win
                     print(f"Pygame: Keypress detected - closing popup")
                     rotation_stop_flag.set()
                     running = False
+                    if on_close is not None:
+                        on_close()
 
             # Update tonearm animation
             tonearm.update(dt)
@@ -662,9 +666,12 @@ def rotate_record_pygame(image_path, rotation_stop_flag, window_x, window_y, win
             pygame.quit()
         except:
             pass
+    finally:
+        if rotation_done is not None:
+            rotation_done.set()
 
 
-def display_rotating_record_popup(MusicMasterSongList, counter, song_duration=180, elapsed_time=0):
+def display_rotating_record_popup(MusicMasterSongList, counter, song_duration=180, elapsed_time=0, on_close=None, rotation_done=None):
     """
     Display a rotating record popup during song playback using pygame.
 
@@ -678,6 +685,10 @@ def display_rotating_record_popup(MusicMasterSongList, counter, song_duration=18
         counter (int): Index of the current song in MusicMasterSongList
         song_duration (int): Duration of the song in seconds
         elapsed_time (int): Time already elapsed in the song in seconds
+        on_close (callable): Optional callback run from the pygame thread when a keypress
+            closes the popup, so the GUI can react without polling rotation_stop_flag
+        rotation_done (threading.Event): Optional event set once the pygame thread has finished,
+            so the GUI can wait for the window to go away instead of sleeping a fixed time
 
     Returns:
         tuple: (rotation_stop_flag, popup_start_time) for lifecycle management
@@ -819,7 +830,9 @@ def display_rotating_record_popup(MusicMasterSongList, counter, song_duration=18
                 POPUP_HEIGHT,
                 POPUP_WINDOW_NO_TITLEBAR,
                 song_duration,
-                elapsed_time
+                elapsed_time,
+                on_close,
+                rotation_done
             ),
             daemon=True
         )
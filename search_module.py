@@ -5,10 +5,137 @@ Provides title and artist search functionality
 
 import FreeSimpleGUI as sg
 import time
+from bisect import bisect_left
 from search_window_button_layout_module import create_search_window_button_layout
+from button_state_module import set_disabled
+from window_visibility_module import hide_windows, unhide_windows
+from console_log_module import console_log
 
+# Print search window events and lookup details to the console
+DEBUG = False
 
-def run_search(search_type, MusicMasterSongList, all_artists_list, main_windows, callback_functions):
+# The five search result buttons, top to bottom
+_RESULT_KEY_ORDER = tuple(f'--result_{word}--' for word in ('one', 'two', 'three', 'four', 'five'))
+_RESULT_KEYS = frozenset(_RESULT_KEY_ORDER)
+
+# Search window, built on the first search and then hidden between searches
+_search_window = None
+
+# Keypad button key -> the character it enters (most buttons are keyed by their own character)
+_TYPED_CHARACTERS = {**{character: character for character in "BCDEFGHIJKLMNOPQRSTUVWXYZ1234567890-'"},
+                     "--A--": "A", "--space--": " "}
+
+# Focus navigation, clear and exit events
+_NAV_KEYS = frozenset(('-NEXT-', '-PREV-', '-UP-', '-DOWN-', '--CLEAR--', '--EXIT--'))
+
+
+def _open_search_window(search_type):
+    """
+    Show the search window, building it on first use.
+
+    The window is hidden rather than closed when a search ends, so later searches reuse
+    it instead of rebuilding the whole keyboard layout.
+
+    Args:
+        search_type (str): "title" or "artist"
+
+    Returns:
+        sg.Window: The search window, with the entry cleared and the A button focused
+    """
+    global _search_window
+    if _search_window is None or _search_window.was_closed():
+        # Search Windows Button Layout
+        search_window_button_layout = create_search_window_button_layout()
+        _search_window = sg.Window('', search_window_button_layout, modal=True, no_titlebar = True, size = (1280,720),
+            default_button_element_size=(5, 2), auto_size_buttons=False, background_color='black',
+            button_color=["firebrick4", "goldenrod1"], font="Helvetica 16 bold", finalize=True)
+        _search_window.bind('<Right>', '-NEXT-')
+        _search_window.bind('<Left>', '-PREV-')
+        _search_window.bind('<Up>', '-UP-')
+        _search_window.bind('<Down>', '-DOWN-')
+        _search_window.bind('<S>', '--SELECTED_LETTER--')
+        _search_window.bind('<C>', '--DELETE--')
+        _search_window.bind('<Escape>', '--ESC--')
+    else:
+        _search_window.UnHide()
+        _search_window.make_modal()
+        _search_window["--letter_entry--"].update("")
+
+    _search_window["--search_type--"].update("Search For Artist" if search_type == "artist" else "Search For Title")
+    # Apply focus highlighting to A button (reversed colors)
+    _search_window['--A--'].update(button_color=["goldenrod1", "firebrick4"])
+    _search_window['--A--'].set_focus()
+    return _search_window
+
+
+def _build_prefix_index(entries):
+    """
+    Build a sorted index for case-insensitive prefix searches.
+
+    Args:
+        entries (iterable): (search_text, result_label) pairs in the order results are listed
+
+    Returns:
+        tuple: (keys, results) - keys is a tuple of the lowercased search text in sorted order,
+            results a tuple of the matching (position, result_label) for each key
+    """
+    ordered = sorted((search_text.lower(), position, result_label)
+                     for position, (search_text, result_label) in enumerate(entries))
+    return tuple(entry[0] for entry in ordered), tuple(entry[1:] for entry in ordered)
+
+
+def _prefix_matches(prefix_index, keys_entered):
+    """
+    Find the result labels whose search text starts with the keys entered, ignoring case.
+
+    Args:
+        prefix_index (tuple): (keys, results) from _build_prefix_index()
+        keys_entered (str): Text typed into the search window
+
+    Returns:
+        list: Matching result labels, in their original listing order
+    """
+    keys, results = prefix_index
+    query = keys_entered.lower()
+    # Every key starting with query sorts at or after query and before its successor string
+    # (query with the last character bumped by one), whatever characters follow the prefix
+    start = bisect_left(keys, query)
+    if query:
+        end = bisect_left(keys, query[:-1] + chr(ord(query[-1]) + 1), start)
+    else:
+        end = len(keys)
+    return [result_label for _, result_label in sorted(results[start:end])]
+
+
+def build_search_indexes(MusicMasterSongList):
+    """
+    Build the lookup tables used to find search results and resolve a clicked result to its song.
+
+    Args:
+        MusicMasterSongList (list): The master list of all songs
+
+    Returns:
+        tuple: (song_label_index, artist_index, title_prefix_index, artist_prefix_index) -
+            song_label_index maps each "artist - title" result label to the first song with
+            that label, artist_index maps each artist to their first song in the list, and
+            the prefix indexes find title and artist results from the keys entered
+    """
+    song_label_index = {}
+    artist_index = {}
+    title_entries = []
+    for song in MusicMasterSongList:
+        song_label = f"{song['artist']} - {song['title']}"
+        song_label_index.setdefault(song_label, song)
+        artist_index.setdefault(song['artist'], song)
+        title_entries.append((song['title'], song_label))
+    title_prefix_index = _build_prefix_index(title_entries)
+    # Artists are listed in the same sorted order as all_artists_list
+    artist_prefix_index = _build_prefix_index((artist, artist) for artist in sorted(artist_index))
+    return song_label_index, artist_index, title_prefix_index, artist_prefix_index
+
+
+def run_search(search_type, MusicMasterSongList, all_artists_list, main_windows, callback_functions,
+               search_indexes=None):
     """
     Run the search interface for title or artist search.
 
@@ -29,6 +156,8 @@ def run_search(search_type, MusicMasterSongList, all_artists_list, main_windows,
             - 'disable_a_selection_buttons'
             - 'disable_b_selection_buttons'
             - 'disable_c_selection_buttons'
+        search_indexes (tuple): The lookup tables from build_search_indexes();
+            built from MusicMasterSongList when not supplied
 
     Returns:
         dict: {'song_number': int, 'song_selected': str} if song selected
@@ -43,6 +172,16 @@ def run_search(search_type, MusicMasterSongList, all_artists_list, main_windows,
     song_playing_lookup_window = main_windows['song_playing_lookup_window']
     window_background = main_windows['window_background']
 
+    # Windows hidden while searching, and the ones brought back afterwards
+    hidden_windows = (right_arrow_selection_window, left_arrow_selection_window, jukebox_selection_window,
+                      info_screen_window, control_button_window, song_playing_lookup_window, window_background)
+    restored_windows = (right_arrow_selection_window, left_arrow_selection_window, jukebox_selection_window,
+                        info_screen_window, control_button_window, window_background)
+
+    if search_indexes is None:
+        search_indexes = build_search_indexes(MusicMasterSongList)
+    song_label_index, artist_index, title_prefix_index, artist_prefix_index = search_indexes
+
     # Extract callback functions
     selection_buttons_update = callback_functions['selection_buttons_update']
     disable_a_selection_buttons = callback_functions['disable_a_selection_buttons']
@@ -53,31 +192,94 @@ def run_search(search_type, MusicMasterSongList, all_artists_list, main_windows,
     search_flag = search_type
 
     # Hide jukebox interface and bring up title search interface
-    right_arrow_selection_window.Hide()
-    left_arrow_selection_window.Hide()
-    jukebox_selection_window.Hide()
-    info_screen_window.Hide()
-    control_button_window.Hide()
-    song_playing_lookup_window.Hide()
-    window_background.Hide()
-
-    # Search Windows Button Layout
-    search_window_button_layout = create_search_window_button_layout()
-    search_window = sg.Window('', search_window_button_layout, modal=True, no_titlebar = True, size = (1280,720),
-        default_button_element_size=(5, 2), auto_size_buttons=False, background_color='black',
-        button_color=["firebrick4", "goldenrod1"], font="Helvetica 16 bold", finalize=True)
+    hide_windows(hidden_windows)
 
-    # Apply focus highlighting to A button (reversed colors)
-    search_window['--A--'].update(button_color=["goldenrod1", "firebrick4"])
-    search_window['--A--'].set_focus()
-    search_window.bind('<Right>', '-NEXT-')
-    search_window.bind('<Left>', '-PREV-')
-    search_window.bind('<Up>', '-UP-')
-    search_window.bind('<Down>', '-DOWN-')
-    search_window.bind('<S>', '--SELECTED_LETTER--')
-    search_window.bind('<C>', '--DELETE--')
-    search_window.bind('<Escape>', '--ESC--')
+    search_window = _open_search_window(search_flag)
+    result_buttons = [search_window[key] for key in _RESULT_KEY_ORDER]
+
+    def clear_result_buttons():
+        # Blank and hide the five result buttons (re-enabling the first), then flush Tk once
+        result_buttons[0].update("", visible=False, disabled=False)
+        for result_button in result_buttons[1:]:
+            result_button.update("", visible=False)
+        search_window.TKroot.update_idletasks()
+
+    def close_search_window():
+        # Hide the window for the next search: drop the focus highlight and release the modal grab
+        search_window[current_focused_button].update(button_color=NORMAL_COLORS)
+        search_window.TKroot.grab_release()
+        search_window.Hide()
+
+    # A reused window still shows the previous search's results
+    clear_result_buttons()
+
+    def find_title_results(keys_entered):
+        # Songs whose title starts with the keys entered, as "artist - title" labels
+        return _prefix_matches(title_prefix_index, keys_entered)
+
+    def find_artist_results(keys_entered):
+        # Artists whose name starts with the keys entered
+        if DEBUG:
+            console_log(keys_entered)
+        return _prefix_matches(artist_prefix_index, keys_entered)
+
+    def select_title_result(song):
+        #Song number found
+        # Song number assigned to song_selected_number variable
+        song_selected_number = song['number']
+        # Code to set main jukeox selection window screen for selected song
+        selection_window_number = song_selected_number
+        selection_buttons_update(selection_window_number)
+        # Code to update the main jukebox selection window position A1 to the selected song
+        jukebox_selection_window['--button0_top--'].update(text = song['title'])
+        jukebox_selection_window['--button0_bottom--'].update(text = song['artist'])
+        # Code to set main main jukebox selection window to selected song
+        disable_a_selection_buttons()
+        control_button_window['--A--'].update(disabled=True)
+        jukebox_selection_window['--button0_top--'].update(disabled = False)
+        jukebox_selection_window['--button0_bottom--'].update(disabled = False)
+        control_button_window['--select--'].update(disabled = False)
+        disable_b_selection_buttons()
+        disable_c_selection_buttons()
+        # Requied by the main jukebox selection window
+        song_selected = "A1"
+        # Code to restore main jukebox windows
+        unhide_windows(restored_windows)
+        # hide title search window for reuse
+        close_search_window()
+        return {'song_number': song_selected_number, 'song_selected': song_selected}
+
+    def select_artist_result(song):
+        # Song number found - the first song by exactly this artist
+        if DEBUG:
+            console_log('artist match found')
+            console_log("Title Selected is number: " + str(song['number']))
+            console_log("Artist Selected is: " + str(song['artist']))
+        # Song number assigned ot song_selected_number variable
+        song_selected_number = song['number']
+        # Code to set main jukeox selection window screen for selected song
+        selection_window_number = song_selected_number
+        selection_buttons_update(selection_window_number)
+        # Code to restore main jukebox windows
+        unhide_windows(restored_windows)
+        # hide artist search window for reuse
+        close_search_window()
+        # Note: Artist search doesn't set song_selected like title search does
+        # Return just the song_number for now
+        return {'song_number': song_selected_number, 'song_selected': None}
+
+    # The search type is fixed for the whole session, so choose its lookup and handlers once
+    # rather than testing search_flag on every event
+    if search_flag == "title":
+        result_index, select_result, find_results = song_label_index, select_title_result, find_title_results
+    else:
+        result_index, select_result, find_results = artist_index, select_artist_result, find_artist_results
+
+    # Characters typed so far, joined into keys_entered once per event
+    keys_buffer = []
     keys_entered = ''
+    # Keys the result buttons were last drawn for, None when they need drawing
+    last_query = None
     search_results = []
 
     # Button grid mapping for Up/Down navigation: {button_key: (row, col)}
@@ -110,26 +312,18 @@ def run_search(search_type, MusicMasterSongList, all_artists_list, main_windows,
     # Track currently focused button for color highlighting
     current_focused_button = '--A--'
 
-    # Set search window to artist if Artist search selected
-    if search_flag == "artist":
-        search_window["--search_type--"].update("Search For Artist")
-
     # Keyboard event loop for title search window
     while True:
         event, values = search_window.read()  # read the title_search_window
-        print(event, values)
+        if DEBUG:
+            console_log(f'{event} {values}')
         # Handle ESC key in search window
         if event == '--ESC--':
-            search_window.close()
+            close_search_window()
             # Restore main jukebox windows
-            right_arrow_selection_window.UnHide()
-            left_arrow_selection_window.UnHide()
-            jukebox_selection_window.UnHide()
-            info_screen_window.UnHide()
-            control_button_window.UnHide()
-            window_background.UnHide()
+            unhide_windows(restored_windows)
             return None
-        if event == "-NEXT-" or event == "-PREV-" or event == "-UP-" or event == "-DOWN-" or event == "--CLEAR--" or event == '--EXIT--':
+        if event in _NAV_KEYS:
             if event == "-NEXT-":
                 next_element = search_window.find_element_with_focus().get_next_focus()
                 next_key = next_element.Key
@@ -212,374 +406,74 @@ def run_search(search_type, MusicMasterSongList, all_artists_list, main_windows,
                             search_window[target_key].set_focus()
                             current_focused_button = target_key
             if event == "--CLEAR--":  # clear keys if clear button
+                keys_buffer.clear()
                 keys_entered = ""
+                last_query = None
                 search_results = []
                 search_window["--letter_entry--"].Update(keys_entered)
-                search_window["--result_one--"].update("", visible=False, disabled=False)
-                search_window["--result_two--"].update("", visible=False)
-                search_window["--result_three--"].update("", visible=False)
-                search_window["--result_four--"].update("", visible=False)
-                search_window["--result_five--"].update("", visible=False)
+                clear_result_buttons()
             if event == "--EXIT--":
                 #  Code to restore main jukebox windows
-                right_arrow_selection_window.UnHide()
-                left_arrow_selection_window.UnHide()
-                jukebox_selection_window.UnHide()
-                info_screen_window.UnHide()
-                control_button_window.UnHide()
-                window_background.UnHide()
-                # Clear search results
-                keys_entered = ""
-                # close title search window
-                search_window.close()
+                unhide_windows(restored_windows)
+                # hide title search window for reuse
+                close_search_window()
                 return None
         else:
-            # Code specific to title search
-            if search_flag == "title":
-                if event == "--result_one--" or event == "--result_two--" or event == "--result_three--" or event == "--result_four--" or event == "--result_five--":
-                    button_text = search_window[event].get_text()
-                    song_search = f'{button_text}'
-                    # Code to search for song number
-                    for i in range(len(MusicMasterSongList)):
-                        if song_search == str(MusicMasterSongList[i]['artist'] + ' - ' + str(MusicMasterSongList[i]['title'])):
-                            #Song number found
-                            # Song number assigned to song_selected_number variable
-                            song_selected_number = MusicMasterSongList[i]['number']
-                            # Code to set main jukeox selection window screen for selected song
-                            selection_window_number = song_selected_number
-                            selection_buttons_update(selection_window_number)
-                            # Code to update the main jukebox selection window position A1 to the selected song
-                            jukebox_selection_window['--button0_top--'].update(text = MusicMasterSongList[i]['title'])
-                            jukebox_selection_window['--button0_bottom--'].update(text = MusicMasterSongList[i]['artist'])
-                            # Code to set main main jukebox selection window to selected song
-                            disable_a_selection_buttons()
-                            control_button_window['--A--'].update(disabled=True)
-                            jukebox_selection_window['--button0_top--'].update(disabled = False)
-                            jukebox_selection_window['--button0_bottom--'].update(disabled = False)
-                            control_button_window['--select--'].update(disabled = False)
-                            disable_b_selection_buttons()
-                            disable_c_selection_buttons()
-                            # Requied by the main jukebox selection window
-                            song_selected = "A1"
-                            # Code to restore main jukebox windows
-                            window_background.UnHide()
-                            right_arrow_selection_window.UnHide()
-                            left_arrow_selection_window.UnHide()
-                            jukebox_selection_window.UnHide()
-                            info_screen_window.UnHide()
-                            control_button_window.UnHide()
-                            # Clear search results
-                            keys_entered = ""
-                            # close title search window
-                            search_window.close()
-                            return {'song_number': song_selected_number, 'song_selected': song_selected}
-                    #Skip code that updates main Jukebox windows
-                    break
-            if search_flag == "artist":
-                if event == "--result_one--" or event == "--result_two--" or event == "--result_three--" or event == "--result_four--" or event == "--result_five--":
-                    button_text = search_window[event].get_text()
-                    song_search = f'{button_text}'
-                    #  Locate song number
-                    counter = 0
-                    for i in MusicMasterSongList:
-                        if song_search in MusicMasterSongList[counter]['artist']:
-                            print('artist looking for is: ' + str(song_search))
-                            print('artist match found')
-                            # Song Number Start Found
-                            if len(song_search) == len(MusicMasterSongList[counter]['artist']):
-                                print(MusicMasterSongList[counter]['number'])
-                                # Song number found
-                                #print(find_list[counter])
-                                print("Title Selected is number: " + str(MusicMasterSongList[counter]['number']))
-                                print("Artist Selected is: " + str(MusicMasterSongList[counter]['artist']))
-                                # Song number assigned ot song_selected_number variable
-                                song_selected_number = MusicMasterSongList[counter]['number']
-                                # Code to set main jukeox selection window screen for selected song
-                                selection_window_number = song_selected_number
-                                selection_buttons_update(selection_window_number)
-                                # Code to restore main jukebox windows
-                                right_arrow_selection_window.UnHide()
-                                left_arrow_selection_window.UnHide()
-                                jukebox_selection_window.UnHide()
-                                info_screen_window.UnHide()
-                                control_button_window.UnHide()
-                                window_background.UnHide()
-                                # Clear search results
-                                keys_entered = ""
-                                # close artist search window
-                                search_window.close()
-                                # Note: Artist search doesn't set song_selected like title search does
-                                # Return just the song_number for now
-                                return {'song_number': song_selected_number, 'song_selected': None}
-                            else:
-                                pass
-                        counter += 1
-                    #Skip code that updates main Jukebox windows
-                    break
+            # Result clicked - look up its song with this search type's index and hand it to the main windows
+            if event in _RESULT_KEYS:
+                button_text = search_window[event].get_text()
+                song_search = f'{button_text}'
+                song = result_index.get(song_search)
+                if song is not None:
+                    return select_result(song)
+                #Skip code that updates main Jukebox windows
+                break
             if event == sg.WIN_CLOSED:  # if the X button clicked, just exit
                 break
             # Code to update the search results based on the keys entered via the keypad
             if (event) == "--SELECTED_LETTER--":
                 selected_letter_entry = search_window.find_element_with_focus()
                 selected_letter_entry.Click()
-                # key_entry(keys_entered)
-                if event == "A":
-                    keys_entered = keys_entered + "A"
-                if event == "B":
-                    keys_entered = keys_entered + "B"
-                if event == "C":
-                    keys_entered = keys_entered + "C"
-                if event == "D":
-                    keys_entered = keys_entered + "D"
-                if event == "E":
-                    keys_entered = keys_entered + "E"
-                if event == "F":
-                    keys_entered = keys_entered + "F"
-                if event == "G":
-                    keys_entered = keys_entered + "G"
-                if event == "H":
-                    keys_entered = keys_entered + "H"
-                if event == "I":
-                    keys_entered = keys_entered + "I"
-                if event == "J":
-                    keys_entered = keys_entered + "J"
-                if event == "K":
-                    keys_entered = keys_entered + "K"
-                if event == "L":
-                    keys_entered = keys_entered + "L"
-                if event == "M":
-                    keys_entered = keys_entered + "M"
-                if event == "N":
-                    keys_entered = keys_entered + "N"
-                if event == "O":
-                    keys_entered = keys_entered + "O"
-                if event == "P":
-                    keys_entered = keys_entered + "P"
-                if event == "Q":
-                    keys_entered = keys_entered + "Q"
-                if event == "R":
-                    keys_entered = keys_entered + "R"
-                if event == "S":
-                    keys_entered = keys_entered + "S"
-                if event == "T":
-                    keys_entered = keys_entered + "T"
-                if event == "U":
-                    keys_entered = keys_entered + "U"
-                if event == "V":
-                    keys_entered = keys_entered + "V"
-                if event == "W":
-                    keys_entered = keys_entered + "W"
-                if event == "X":
-                    keys_entered = keys_entered + "X"
-                if event == "Y":
-                    keys_entered = keys_entered + "Y"
-                if event == "Z":
-                    keys_entered = keys_entered + "Z"
-                if event == "1":
-                    keys_entered = keys_entered + "1"
-                if event == "2":
-                    keys_entered = keys_entered + "2"
-                if event == "3":
-                    keys_entered = keys_entered + "3"
-                if event == "4":
-                    keys_entered = keys_entered + "4"
-                if event == "5":
-                    keys_entered = keys_entered + "5"
-                if event == "6":
-                    keys_entered = keys_entered + "6"
-                if event == "7":
-                    keys_entered = keys_entered + "7"
-                if event == "8":
-                    keys_entered = keys_entered + "8"
-                if event == "9":
-                    keys_entered = keys_entered + "9"
-                if event == "0":
-                    keys_entered = keys_entered + "0"
-            if event == "--DELETE--":
-                keys_entered = keys_entered[:-1]
-            if event == "--space--":
-                keys_entered += " "
-            elif event == "-":
-                keys_entered += "-"
-            elif event == "'":
-                keys_entered += "'"
+            if event == "--DELETE--" and keys_buffer:
+                keys_buffer.pop()
             # Code to update the search results based on the keys entered via a computer keyboard or mouse
-            elif event in "1234567890ABCDEFGHIJKLMNOPQRSTUVWXYZ":
-                print(event, values)
-                if event == "B":
-                    keys_entered = keys_entered + "B"
-                if event == "C":
-                    keys_entered = keys_entered + "C"
-                if event == "D":
-                    keys_entered = keys_entered + "D"
-                if event == "E":
-                    keys_entered = keys_entered + "E"
-                if event == "F":
-                    keys_entered = keys_entered + "F"
-                if event == "G":
-                    keys_entered = keys_entered + "G"
-                if event == "H":
-                    keys_entered = keys_entered + "H"
-                if event == "I":
-                    keys_entered = keys_entered + "I"
-                if event == "J":
-                    keys_entered = keys_entered + "J"
-                if event == "K":
-                    keys_entered = keys_entered + "K"
-                if event == "L":
-                    keys_entered = keys_entered + "L"
-                if event == "M":
-                    keys_entered = keys_entered + "M"
-                if event == "N":
-                    keys_entered = keys_entered + "N"
-                if event == "O":
-                    keys_entered = keys_entered + "O"
-                if event == "P":
-                    keys_entered = keys_entered + "P"
-                if event == "Q":
-                    keys_entered = keys_entered + "Q"
-                if event == "R":
-                    keys_entered = keys_entered + "R"
-                if event == "S":
-                    keys_entered = keys_entered + "S"
-                if event == "T":
-                    keys_entered = keys_entered + "T"
-                if event == "U":
-                    keys_entered = keys_entered + "U"
-                if event == "V":
-                    keys_entered = keys_entered + "V"
-                if event == "W":
-                    keys_entered = keys_entered + "W"
-                if event == "X":
-                    keys_entered = keys_entered + "X"
-                if event == "Y":
-                    keys_entered = keys_entered + "Y"
-                if event == "Z":
-                    keys_entered = keys_entered + "Z"
-                if event == "1":
-                    keys_entered = keys_entered + "1"
-                if event == "2":
-                    keys_entered = keys_entered + "2"
-                if event == "3":
-                    keys_entered = keys_entered + "3"
-                if event == "4":
-                    keys_entered = keys_entered + "4"
-                if event == "5":
-                    keys_entered = keys_entered + "5"
-                if event == "6":
-                    keys_entered = keys_entered + "6"
-                if event == "7":
-                    keys_entered = keys_entered + "7"
-                if event == "8":
-                    keys_entered = keys_entered + "8"
-                if event == "9":
-                    keys_entered = keys_entered + "9"
-                if event == "0":
-                    keys_entered = keys_entered + "0"
-                print(keys_entered)
+            typed_character = _TYPED_CHARACTERS.get(event)
+            if typed_character is not None:
+                keys_buffer.append(typed_character)
+                if DEBUG:
+                    console_log(f'{event} {values}')
             elif event == "Submit":
-                keys_entered = values["input"]
-                search_window["out"].update(keys_entered)  # output the final stringsd
-            if event == "--A--":
-                keys_entered = keys_entered + "A"
-            print(keys_entered)
+                keys_buffer[:] = values["input"]
+                search_window["out"].update(values["input"])  # output the final stringsd
+            keys_entered = "".join(keys_buffer)
+            # Nothing typed since the results were last drawn (e.g. --SELECTED_LETTER--, whose click
+            # arrives as its own event) - the result buttons and letter entry are already current
+            if keys_entered == last_query:
+                continue
+            last_query = keys_entered
+            if DEBUG:
+                console_log(keys_entered)
             # Code to bring up search results based on keys entered
-            # Code to search for song title based on keys entered
-            if search_flag == "title":
-                for i, item in enumerate(MusicMasterSongList):
-                    find_list_search = MusicMasterSongList[i]['title']
-                    match = find_list_search.lower().find(keys_entered.lower())
-                    if match == 0:  # ensures match is from left of string
-                        search_results.append(str(MusicMasterSongList[i]['artist']) + " - " + str(MusicMasterSongList[i]['title']))
-            # Code to search for artist based on keys entered
-            if search_flag == "artist":
-                find_list = all_artists_list
-                print(keys_entered)
-                for i, item in enumerate(find_list):
-                    find_list_search = find_list[i]
-                    match = find_list_search.lower().find(keys_entered.lower())
-                    if match == 0:  # ensures match is from left of string
-                        search_results.append(str(find_list[i]))
+            search_results = find_results(keys_entered)
             # Code to update search results on search window
-            if len(search_results) <= 5:
-                search_window["--result_one--"].update(visible=True, disabled=False)
-                search_window["--result_two--"].update(visible=True)
-                search_window["--result_three--"].update(visible=True)
-                search_window["--result_four--"].update(visible=True)
-                search_window["--result_five--"].update(visible=True)
-            if len(search_results) <= 4:
-                search_window["--result_one--"].update(visible=True, disabled=False)
-                search_window["--result_two--"].update(visible=True)
-                search_window["--result_three--"].update(visible=True)
-                search_window["--result_four--"].update(visible=True)
-                search_window["--result_five--"].update(visible=False)
-            if len(search_results) <= 3:
-                search_window["--result_one--"].update(visible=True, disabled=False)
-                search_window["--result_two--"].update(visible=True)
-                search_window["--result_three--"].update(visible=True)
-                search_window["--result_four--"].update(visible=False)
-                search_window["--result_five--"].update(visible=False)
-            if len(search_results) <= 2:
-                search_window["--result_one--"].update(visible=True, disabled=False)
-                search_window["--result_two--"].update(visible=True)
-                search_window["--result_three--"].update(visible=False)
-                search_window["--result_four--"].update(visible=False)
-                search_window["--result_five--"].update(visible=False)
-            if len(search_results) <= 1:
-                search_window["--result_one--"].update(visible=True, disabled=False)
-                search_window["--result_two--"].update(visible=False)
-                search_window["--result_three--"].update(visible=False)
-                search_window["--result_four--"].update(visible=False)
-                search_window["--result_five--"].update(visible=False)
-            if len(search_results) == 0:
-                search_window["--result_one--"].update("Song Title Not On Jukebox", disabled=True)
-                search_window["--result_two--"].update(visible=False)
-                search_window["--result_three--"].update(visible=False)
-                search_window["--result_four--"].update(visible=False)
-                search_window["--result_five--"].update(visible=False)
-            for x in range(len(search_results)):
-                if len(search_results) == 0:
-                    search_window["--result_one--"].update("", disabled=False)
-                    search_window["--result_two--"].update("")
-                    search_window["--result_three--"].update("")
-                    search_window["--result_four--"].update("")
-                    search_window["--result_five--"].update("")
-                if len(search_results) == 1:
-                    search_window["--result_one--"].update(search_results[0], disabled=False)
-                    search_window["--result_two--"].update("")
-                    search_window["--result_three--"].update("")
-                    search_window["--result_four--"].update("")
-                    search_window["--result_five--"].update("")
-                if len(search_results) == 2:
-                    search_window["--result_one--"].update(search_results[0], disabled=False)
-                    search_window["--result_two--"].update(search_results[1])
-                    search_window["--result_three--"].update("")
-                    search_window["--result_four--"].update("")
-                    search_window["--result_five--"].update("")
-                if len(search_results) == 3:
-                    search_window["--result_one--"].update(search_results[0], disabled=False)
-                    search_window["--result_two--"].update(search_results[1])
-                    search_window["--result_three--"].update(search_results[2])
-                    search_window["--result_four--"].update("")
-                    search_window["--result_five--"].update("")
-                if len(search_results) == 4:
-                    search_window["--result_one--"].update(search_results[0], disabled=False)
-                    search_window["--result_two--"].update(search_results[1])
-                    search_window["--result_three--"].update(search_results[2])
-                    search_window["--result_four--"].update(search_results[3])
-                    search_window["--result_five--"].update("")
-                if len(search_results) == 5:
-                    search_window["--result_one--"].update(search_results[0], disabled=False)
-                    search_window["--result_two--"].update(search_results[1])
-                    search_window["--result_three--"].update(search_results[2])
-                    search_window["--result_four--"].update(search_results[3])
-                    search_window["--result_five--"].update(search_results[4])
-                if len(search_results) > 5:
-                    search_window["--result_one--"].update(keys_entered, disabled=False)
-                    search_window["--result_two--"].update(keys_entered)
-                    search_window["--result_three--"].update(keys_entered)
-                    search_window["--result_four--"].update(keys_entered)
-                    search_window["--result_five--"].update(keys_entered)
+            result_count = len(search_results)
+            if result_count == 0:
+                result_buttons[0].update("Song Title Not On Jukebox", visible=True, disabled=True)
+                for result_button in result_buttons[1:]:
+                    result_button.update(visible=False)
+            elif result_count <= 5:
+                # Show one button per result and hide the rest
+                for i, result_button in enumerate(result_buttons):
+                    if i < result_count:
+                        result_button.update(search_results[i], visible=True)
+                    else:
+                        result_button.update("", visible=False)
+                set_disabled(result_buttons[0], False)
+            else:
+                # Too many matches to list - the result buttons echo the keys entered
+                for result_button in result_buttons:
+                    result_button.update(keys_entered)
+                set_disabled(result_buttons[0], False)
         search_results = []
         search_window["--letter_entry--"].Update(keys_entered)
         # End of search window event loop code
@@ -0,0 +1,38 @@
+"""
+Window Visibility Module
+Hides and restores groups of jukebox windows together
+"""
+
+
+def hide_windows(windows):
+    """
+    Hide a group of PySimpleGUI windows, then flush Tk's pending work once.
+
+    All windows share one Tk interpreter, so a single update_idletasks() after the
+    whole group is withdrawn lets the window manager handle the changes together
+    instead of redrawing between each one.
+
+    Args:
+        windows (tuple): PySimpleGUI windows to hide, in order
+
+    Returns:
+        None
+    """
+    for window in windows:
+        window.Hide()
+    windows[0].TKroot.update_idletasks()
+
+
+def unhide_windows(windows):
+    """
+    Restore a group of PySimpleGUI windows hidden with hide_windows(), flushing once.
+
+    Args:
+        windows (tuple): PySimpleGUI windows to restore, in order
+
+    Returns:
+        None
+    """
+    for window in windows:
+        window.UnHide()
+    windows[0].TKroot.update_idletasks()